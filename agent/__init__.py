@@ -4,6 +4,7 @@ EigenLayer AI Agent package
 
 from .llm import OpenRouterBackend
 from .manager import AgentManager
+from .multicall import Multicall
 from .oracle import Oracle, TaskStatus
 from .registry import Registry
 
@@ -12,5 +13,6 @@ __all__ = [
     "TaskStatus",
     "Registry",
     "AgentManager",
+    "Multicall",
     "OpenRouterBackend",
 ]
@@ -10,9 +10,10 @@ import argparse
 import asyncio
 import json
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -21,9 +22,26 @@ from web3.exceptions import ContractLogicError
 from agent.llm import OpenRouterBackend
 from agent.manager import AgentManager
 from agent.oracle import Oracle, TaskStatus
-from agent.utils.config import load_config
+from agent.utils.bitset import TaskIndexSet
+from agent.utils.config import load_config, read_json
 from agent.utils.logger import setup_logging
-from agent.utils.web3 import setup_web3
+from agent.utils.shutdown import install_shutdown_event
+from agent.utils.web3 import health_check, setup_web3
+
+# Prompt for the direct LLM fallback; only the question varies
+FALLBACK_PROMPT_TEMPLATE = """
+You are evaluating a prediction market question.
+Your task is to respond with either YES or NO,
+followed by a brief explanation of your reasoning.
+
+Question: {question}
+
+Response format: Start with YES or NO (capitalized),
+followed by your explanation.
+"""
+
+# Leading YES/NO of a free-form LLM response
+YES_NO_PATTERN = re.compile(r"\s*(YES|NO)\b", re.IGNORECASE)
 
 
 class PredictionMarketBridge:
@@ -45,6 +63,7 @@ class PredictionMarketBridge:
         # Set up Web3 connection
         provider_uri = self.config.get("rpc_url", "http://localhost:8545")
         self.web3 = setup_web3(provider_uri)
+        health_check(self.web3)
 
         # Load SENSITIVE keys from environment variables
         self.agent_private_key = os.getenv("AGENT_PRIVATE_KEY")
@@ -75,7 +94,12 @@ class PredictionMarketBridge:
                 "and ORACLE_ADDRESS env var not set."
             )
 
-        self.oracle = Oracle(self.web3, oracle_addr, self.agent_private_key)
+        self.oracle = Oracle(
+            self.web3,
+            oracle_addr,
+            self.agent_private_key,
+            deployment_block=self.config.get("oracle_deployment_block", 0),
+        )
         logger.info(f"Connected to Oracle at {oracle_addr}")
 
         # Use registry address from config
@@ -136,11 +160,9 @@ class PredictionMarketBridge:
         if effective_market_address:
             # Load ABI for PredictionMarketHook
             try:
-                with open(
-                    Path(__file__).parent.parent / "abis" / "PredictionMarketHook.json",
-                    "r",
-                ) as f:
-                    hook_abi = json.load(f)
+                hook_abi = read_json(
+                    Path(__file__).parent.parent / "abis" / "PredictionMarketHook.json"
+                )
                 self.market_hook = self.web3.eth.contract(
                     address=self.web3.to_checksum_address(
                         effective_market_address
@@ -165,7 +187,14 @@ class PredictionMarketBridge:
             )
 
         # Cache for processed tasks
-        self.processed_tasks = set()
+        self.processed_tasks = TaskIndexSet()
+
+        # Every task index below the cursor has been processed
+        self.scan_cursor = 0
+
+        # Set by SIGINT/SIGTERM to end the polling loop; created in run_async
+        # so it belongs to the running event loop
+        self._shutdown: Optional[asyncio.Event] = None
 
     async def run_async(self, interval: int = 30, run_once: bool = False):
         """
@@ -181,29 +210,34 @@ class PredictionMarketBridge:
         if self.agent_manager:
             await self.agent_manager.setup()
 
-        while True:
+        self._shutdown = install_shutdown_event()
+
+        while not self._shutdown.is_set():
             try:
                 # Check for new tasks
                 await self.process_pending_tasks_async()
-
-                # Exit if only running once
-                if run_once:
-                    break
-
-                # Wait before next check
-                await asyncio.sleep(interval)
-
-            except KeyboardInterrupt:
-                logger.info("\nExiting on user request")
-                break
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
                 import traceback
 
                 traceback.print_exc()
-                if run_once:
-                    break
-                await asyncio.sleep(interval)
+
+            # Exit if only running once
+            if run_once:
+                break
+
+            # Wait before next check, waking immediately on shutdown
+            try:
+                await asyncio.wait_for(self._shutdown.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+        # Release the LLM client's pooled connections
+        if self.llm:
+            await self.llm.aclose()
+
+        if self._shutdown.is_set():
+            logger.info("\nExiting on user request")
 
     def run(self, interval: int = 30, run_once: bool = False):
         """
@@ -222,26 +256,34 @@ class PredictionMarketBridge:
         """Async version of process_pending_tasks"""
         try:
             # Get latest task number
-            latest_task_num = self.oracle.contract.functions.latestTaskNum().call()
+            # RPCs run in worker threads so they don't block the event loop
+            latest_task_num = await self.oracle.aget_latest_task_num()
             logger.info(f"Latest task number: {latest_task_num}")
 
-            # Process all unprocessed tasks
-            for task_index in range(latest_task_num):
-                if task_index in self.processed_tasks:
-                    continue
+            # Fetch statuses of all unprocessed tasks in one batch
+            pending = [
+                i
+                for i in range(self.scan_cursor, latest_task_num)
+                if i not in self.processed_tasks
+            ]
+            statuses = await self.oracle.aget_task_statuses(pending)
+
+            # Skip resolved tasks
+            unresolved = []
+            for task_index, task_status in zip(pending, statuses):
+                logger.info(f"Task {task_index} status: {task_status}")
+                if task_status == TaskStatus.RESOLVED:
+                    self.processed_tasks.add(task_index)
+                else:
+                    unresolved.append(task_index)
+
+            # Fetch task data for the rest in one multicall
+            tasks = await self.oracle.areconstruct_tasks(unresolved)
 
-                # Check task status
+            # Process all unprocessed tasks
+            for task_index, task in zip(unresolved, tasks):
                 try:
-                    task_status = self.oracle.get_task_status(task_index)
-                    logger.info(f"Task {task_index} status: {task_status}")
-
-                    # Skip if task is already resolved
-                    if task_status == TaskStatus.RESOLVED:
-                        self.processed_tasks.add(task_index)
-                        continue
-
-                    # Process task
-                    await self.process_task_async(task_index)
+                    await self.process_task_async(task_index, task)
 
                 except ContractLogicError as e:
                     logger.error(f"Error getting task {task_index}: {e}")
@@ -251,22 +293,33 @@ class PredictionMarketBridge:
 
                     traceback.print_exc()
 
+            # Skip the processed prefix on the next poll
+            while (
+                self.scan_cursor < latest_task_num
+                and self.scan_cursor in self.processed_tasks
+            ):
+                self.scan_cursor += 1
+
         except Exception as e:
             logger.error(f"Error checking pending tasks: {e}")
             import traceback
 
             traceback.print_exc()
 
-    async def process_task_async(self, task_index: int):
+    async def process_task_async(
+        self, task_index: int, task: Optional[Dict[str, Any]] = None
+    ):
         """
         Async version of process_task
 
         Args:
             task_index: Index of the task to process
+            task: Task data if already fetched, reconstructed otherwise
         """
         try:
             # Get task data
-            task = self.oracle.reconstruct_task(task_index)
+            if task is None:
+                task = await self.oracle.areconstruct_task(task_index)
             # Task reconstruction might return None or raise error if task not found
             if not task:
                 logger.warning(f"Could not reconstruct task {task_index}. Skipping.")
@@ -279,7 +332,7 @@ class PredictionMarketBridge:
             )
 
             # Check if task meets processing criteria (e.g., market state)
-            if not self.should_process_task(task_index, task):
+            if not await asyncio.to_thread(self.should_process_task, task_index, task):
                 # Reason for skipping is logged within should_process_task
                 self.processed_tasks.add(task_index)
                 return
@@ -411,39 +464,27 @@ class PredictionMarketBridge:
         """
         # Use manager if available, otherwise use direct implementation
         if self.agent_manager:
-            return self.agent_manager.get_ai_response(task)
+            return await self.agent_manager.get_ai_response_async(task)
 
         # --- Direct Implementation (Fallback/Alternative) ---
         # This part should ideally not be used if AgentManager is correctly set up
         logger.warning("Using direct LLM call, AgentManager might not be configured.")
 
-        task_content = task.get("name", "")
-
-        prompt = f"""
-        You are evaluating a prediction market question.
-        Your task is to respond with either YES or NO,
-        followed by a brief explanation of your reasoning.
-
-        Question: {task_content}
-
-        Response format: Start with YES or NO (capitalized),
-        followed by your explanation.
-        """
+        prompt = FALLBACK_PROMPT_TEMPLATE.format(question=task.get("name", ""))
 
         # Call AI agent if available or return mock response for testing
         if self.llm:
-            response = self.llm.generate_response(prompt)
+            response = await self.llm.agenerate_response(prompt)
             logger.info(f"AI response: {response}")
         else:
             # Mock response for testing when no API key is available
             logger.info("Using mock response (no API key provided)")
             response = "YES, based on current market trends and analyst projections."
 
-        # Extract YES/NO from response
-        if response.startswith("YES"):
-            decision = "YES"
-        elif response.startswith("NO"):
-            decision = "NO"
+        # Extract YES/NO from the start of the response
+        match = YES_NO_PATTERN.match(response)
+        if match:
+            decision = match.group(1).upper()
         else:
             # Default to NO if unclear
             logger.info(f"Could not extract clear YES/NO from response: {response}")
@@ -453,26 +494,14 @@ class PredictionMarketBridge:
         # --- End Direct Implementation ---
 
     def get_optimal_gas_price(self):
-        """Get optimal gas price based on recent blocks"""
-        # Get gas prices from last few blocks
-        gas_prices = []
-        latest_block = self.web3.eth.block_number
-
-        # Sample gas prices from recent transactions
-        for i in range(5):  # Only check last 5 blocks
-            if latest_block - i >= 0:
-                block = self.web3.eth.get_block(latest_block - i, True)
-                for tx in block.transactions[:5]:  # Limit to 5 transactions per block
-                    if hasattr(tx, "gasPrice"):
-                        gas_prices.append(tx.gasPrice)
-
-        if not gas_prices:
+        """Get optimal gas price based on the fee history of recent blocks"""
+        # Use a lower percentile for less urgent transactions
+        base_fee, priority_fee = self.oracle.get_fee_estimate(30)
+
+        if not priority_fee:
             return self.web3.eth.gas_price
 
-        # Use a lower percentile for less urgent transactions
-        gas_prices.sort()
-        index = int(len(gas_prices) * 0.3)  # 30th percentile
-        return gas_prices[index]
+        return base_fee + priority_fee
 
     async def submit_response_async(
         self, task_index: int, task: Dict[str, Any], response: str
@@ -488,7 +517,9 @@ class PredictionMarketBridge:
         """
         # If manager is available, let it handle response submission
         if self.agent_manager:
-            self.agent_manager.submit_response(task_index, task, response)
+            await asyncio.to_thread(
+                self.agent_manager.submit_response, task_index, task, response
+            )
             return
         else:
             # This case should not happen if registry_address is in config
@@ -500,49 +531,6 @@ class PredictionMarketBridge:
             # raise ValueError("AgentManager not available for response submission")
             return
 
-        # --- Removed Direct Submission Logic ---
-        # The following logic directly called the Oracle and bypassed the AIAgent,
-        # which is incorrect for the intended flow.
-
-        # if not self.account:
-        #     raise ValueError("Cannot submit response without a private key")
-        #
-        # # Create task struct to pass to respondToTask
-        # task_struct = {
-        #     "name": task.get("name", ""),
-        #     "taskCreatedBlock": task.get("taskCreatedBlock", 0),
-        # }
-        #
-        # # Sign the response - THIS IS NOT THE SIGNATURE THE CONTRACT EXPECTS
-        # # The contract expects the signature to *be* the response data
-        # # for the AgentManager flow. Direct signing here is misleading.
-        # message = f"Task {task_index} response: {response[:10]}" # Limit message size
-        # signature_hash = self.web3.keccak(text=message)
-        #
-        # try:
-        #     # Use encode_defunct from eth_account.messages if available
-        #     from eth_account.messages import encode_defunct
-        #     signable_message = encode_defunct(hexstr=signature_hash.hex())
-        #     signature = self.web3.eth.account.sign_message(
-        #         signable_message, private_key=self.agent_private_key
-        #     ).signature
-        # except ImportError:
-        #     # Fallback for older web3.py versions
-        #     signature = self.web3.eth.account.sign_message(
-        #         Web3.to_bytes(hexstr=signature_hash.hex()),
-        #         private_key=self.agent_private_key,
-        #     ).signature
-        #
-        # # Submit to blockchain DIRECTLY TO ORACLE - INCORRECT PATH
-        # try:
-        #     nonce = self.web3.eth.get_transaction_count(self.account.address)
-        #     # ... [Rest of direct transaction building logic removed] ...
-        #
-        # except Exception as e:
-        #     logger.error(f"Error submitting response directly: {e}") # Log context
-        #     raise
-        # --- End Removed Direct Submission Logic ---
-
     async def resolve_market_async(self, market_id: str, decision: bool):
         """
         Async version of resolve_market (kept for potential direct use/testing)
@@ -630,9 +618,7 @@ class PredictionMarketBridge:
                 )
 
             # Sign and send
-            signed_tx = self.web3.eth.account.sign_transaction(
-                tx, self.agent_private_key
-            )
+            signed_tx = self.account.sign_transaction(tx)
             tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
 
             # Wait for receipt
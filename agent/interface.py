@@ -7,6 +7,12 @@ from web3 import Web3
 
 from .utils import load_abi
 
+# Gas limit for processTask transactions
+PROCESS_TASK_GAS = 5000000
+
+# 4-byte selector of processTask(uint32 taskIndex, bool decision)
+PROCESS_TASK_SELECTOR = Web3.keccak(text="processTask(uint32,bool)")[:4]
+
 
 class AgentInterface:
     """Client for interacting with the AIAgent contract"""
@@ -45,13 +51,16 @@ class AgentInterface:
         """Get the status of the agent from the contract"""
         return self.contract.functions.status().call()
 
-    def process_task(self, task_index: int, decision: bool):
+    def process_task(
+        self, task_index: int, decision: bool, nonce: Optional[int] = None
+    ):
         """
         Process a task and submit the agent's response
 
         Args:
             task_index: The task index
             decision: The boolean decision (True for YES, False for NO)
+            nonce: Transaction nonce, fetched from the chain if not given
 
         Returns:
             Transaction hash string
@@ -61,21 +70,30 @@ class AgentInterface:
 
         logger.info(f"Processing task {task_index} with decision {decision}")
         gas_price = self.web3.to_wei(1, "gwei")
-
-        tx_build = self.contract.functions.processTask(
-            task_index, decision
-        ).build_transaction(
-            {
-                "from": self.account.address,
-                "nonce": self.web3.eth.get_transaction_count(self.account.address),
-                "gas": 5000000,  # Increased gas limit
-                "gasPrice": gas_price,
-            }
+        if nonce is None:
+            nonce = self.web3.eth.get_transaction_count(self.account.address)
+
+        # Both arguments are static types, so the calldata is the selector
+        # followed by two 32-byte words; no ABI encoder or build_transaction
+        call_data = (
+            PROCESS_TASK_SELECTOR
+            + task_index.to_bytes(32, "big")
+            + int(decision).to_bytes(32, "big")
         )
+        tx_build = {
+            "from": self.account.address,
+            "to": self.address,
+            "data": call_data,
+            "value": 0,
+            "nonce": nonce,
+            "gas": PROCESS_TASK_GAS,
+            "gasPrice": gas_price,
+            "chainId": self.web3.eth.chain_id,
+        }
 
         logger.info(f"Transaction details: {tx_build}")
 
-        signed_tx = self.web3.eth.account.sign_transaction(tx_build, self.private_key)
+        signed_tx = self.account.sign_transaction(tx_build)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
 
         return tx_hash.hex()
@@ -4,10 +4,17 @@ Provides interfaces to AI models and search functionality
 """
 
 import json
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
+import aiohttp
 import requests
 
+# Total timeout in seconds for async LLM requests
+LLM_REQUEST_TIMEOUT = 120
+
+# System message used when the caller does not supply one
+DEFAULT_SYSTEM_PROMPT = "You are a helpful AI assistant."
+
 
 class OpenRouterBackend:
     """Implementation of OpenRouter API to access multiple AI models"""
@@ -48,6 +55,9 @@ class OpenRouterBackend:
             "X-Title": "Vista Market AI Agent",
         }
 
+        # Shared keep-alive session for the async API, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+
     def generate_response(self, query: str) -> str:
         """Generate a response using OpenRouter API"""
 
@@ -79,6 +89,153 @@ class OpenRouterBackend:
 
         return data["choices"][0]["message"]["content"]
 
+    def stream_response(
+        self, query: str, system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a response from the OpenRouter API as server-sent events
+
+        Args:
+            query: The user query
+            system_prompt: System message to send instead of the default
+
+        Yields:
+            Content chunks as they arrive. Closing the generator early closes
+            the HTTP connection, so callers can stop once they have enough.
+        """
+        payload = {**self._chat_payload(query, system_prompt), "stream": True}
+
+        with requests.post(
+            self.api_url,
+            headers=self.request_headers,
+            data=json.dumps(payload),
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                error_detail = (
+                    response.json().get("error", {}).get("message", "Unknown error")
+                )
+                raise Exception(
+                    f"OpenRouter API error ({response.status_code}): {error_detail}"
+                )
+
+            for line in response.iter_lines(decode_unicode=True):
+                content = self._parse_stream_line(line)
+                if content is None:
+                    break
+                if content:
+                    yield content
+
+    async def agenerate_response(
+        self, query: str, system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Generate a response using OpenRouter API without blocking the loop
+
+        Args:
+            query: The user query
+            system_prompt: System message to send instead of the default
+
+        Returns:
+            The response content
+        """
+        payload = self._chat_payload(query, system_prompt)
+
+        session = self._get_session()
+        async with session.post(self.api_url, json=payload) as response:
+            data = await response.json(content_type=None)
+
+        if response.status != 200:
+            error_detail = data.get("error", {}).get("message", "Unknown error")
+            raise Exception(f"OpenRouter API error ({response.status}): {error_detail}")
+
+        if "error" in data:
+            raise Exception(f"OpenRouter API error: {data['error']['message']}")
+
+        return data["choices"][0]["message"]["content"]
+
+    async def astream_response(
+        self, query: str, system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async version of stream_response, using the shared aiohttp session
+
+        Args:
+            query: The user query
+            system_prompt: System message to send instead of the default
+
+        Yields:
+            Content chunks as they arrive
+        """
+        payload = {**self._chat_payload(query, system_prompt), "stream": True}
+
+        session = self._get_session()
+        async with session.post(self.api_url, json=payload) as response:
+            if response.status != 200:
+                data = await response.json(content_type=None)
+                error_detail = data.get("error", {}).get("message", "Unknown error")
+                raise Exception(
+                    f"OpenRouter API error ({response.status}): {error_detail}"
+                )
+
+            async for raw_line in response.content:
+                content = self._parse_stream_line(raw_line.decode("utf-8").strip())
+                if content is None:
+                    break
+                if content:
+                    yield content
+
+    async def aclose(self):
+        """Close the shared aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.request_headers,
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=120),
+                timeout=aiohttp.ClientTimeout(total=LLM_REQUEST_TIMEOUT),
+            )
+        return self._session
+
+    def _chat_payload(
+        self, query: str, system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the chat completion payload for a query"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt or DEFAULT_SYSTEM_PROMPT},
+                {"role": "user", "content": query},
+            ],
+        }
+
+    @staticmethod
+    def _parse_stream_line(line: str) -> Optional[str]:
+        """
+        Parse one server-sent event line of a streamed completion
+
+        Returns:
+            The content delta ("" if the line carries none),
+            or None once the stream is done
+        """
+        # Skip keep-alive comments and blank separators
+        if not line.startswith("data: "):
+            return ""
+
+        data = line[len("data: ") :]
+        if data == "[DONE]":
+            return None
+
+        chunk = json.loads(data)
+        if "error" in chunk:
+            raise Exception(f"OpenRouter API error: {chunk['error']['message']}")
+
+        return chunk["choices"][0].get("delta", {}).get("content") or ""
+
     def search_web(self, query: str) -> List[Dict[str, str]]:
         """
         Search the web for information related to the query using Tavily Search API
@@ -1,15 +1,49 @@
 import asyncio
 import json
+import re
+from contextlib import aclosing
 from enum import IntEnum
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from loguru import logger
 from web3 import Web3
+from web3.exceptions import Web3RPCError
 
 from .interface import AgentInterface
 from .llm import OpenRouterBackend
 from .oracle import Oracle, TaskStatus
 from .registry import Registry
+from .utils import TaskIndexSet, install_shutdown_event
+
+# System message for every task; kept byte-identical across requests so
+# providers that cache prompt prefixes can reuse it
+DECISION_SYSTEM_PROMPT = """You are evaluating a prediction market question.
+Your task is to respond with a JSON object containing two keys:
+1. "decision": Must be either "YES" or "NO" (uppercase).
+2. "explanation": A brief explanation of your reasoning.
+
+Respond ONLY with the JSON object, nothing else.
+Example JSON response:
+{
+  "decision": "YES",
+  "explanation": "Based on current market trends and analyst projections."
+}"""
+
+# Matches the JSON decision field as soon as it has been streamed
+DECISION_PATTERN = re.compile(r'"decision"\s*:\s*"\s*(YES|NO)\s*"', re.IGNORECASE)
+
+
+# Bounds for the adaptive polling interval, in seconds
+MIN_POLLING_INTERVAL = 1
+MAX_POLLING_INTERVAL = 60
+
+# Maximum number of discovered tasks waiting for a worker
+TASK_QUEUE_SIZE = 32
+
+# Transaction receipt polling: give up after RECEIPT_TIMEOUT seconds and
+# poll every RECEIPT_POLL_LATENCY seconds instead of web3's 1s default
+RECEIPT_TIMEOUT = 120
+RECEIPT_POLL_LATENCY = 0.25
 
 
 # Define agent status enum (moved from agent.py)
@@ -19,6 +53,17 @@ class AgentStatus(IntEnum):
     SUSPENDED = 2
 
 
+def _nonce_needs_resync(error: Exception) -> bool:
+    """
+    Whether a failed submit leaves the local nonce counter out of step
+
+    True when the node rejected the transaction (so its nonce was never
+    used) or the error is about the nonce itself. Timeouts while waiting
+    for the receipt mean the transaction was broadcast and keep the counter.
+    """
+    return isinstance(error, Web3RPCError) or "nonce" in str(error).lower()
+
+
 class AgentManager:
     """High-level manager for coordinating AI agents with the oracle system"""
 
@@ -48,6 +93,7 @@ class AgentManager:
         self.agent_address = Web3.to_checksum_address(agent_address)
         self.private_key = private_key
         self.ai_backend = ai_backend
+        self._system_prompt = DECISION_SYSTEM_PROMPT
 
         # Set up account
         if self.private_key:
@@ -63,6 +109,11 @@ class AgentManager:
                 "No private key provided. Only read operations will be available."
             )
 
+        # Lower-cased once for respondent comparisons in the polling loop
+        self._account_address_lc = (
+            self.account.address.lower() if self.account else None
+        )
+
         # Check if agent is registered
         try:
             self.is_registered = self.registry.is_agent_registered(agent_address)
@@ -73,14 +124,58 @@ class AgentManager:
         # Add this for the AIAgent client
         self.agent = AgentInterface(web3, agent_address, private_key)
 
+        # Tasks this process has already answered, so no RPC is needed
+        self._own_responded = TaskIndexSet()
+
+        # Set by SIGINT/SIGTERM or stop() to end monitor_tasks; created in
+        # monitor_tasks so it belongs to the running event loop
+        self._shutdown: Optional[asyncio.Event] = None
+
+        # Locally tracked next nonce; None means resync from the chain
+        self._nonce: Optional[int] = None
+        self._nonce_lock = asyncio.Lock()
+
+    def stop(self):
+        """Request a graceful shutdown of the monitoring loop"""
+        if self._shutdown is not None:
+            self._shutdown.set()
+
+    async def _next_nonce(self) -> int:
+        """Reserve the next transaction nonce, syncing from chain if needed"""
+        async with self._nonce_lock:
+            if self._nonce is None:
+                self._nonce = await asyncio.to_thread(
+                    self.web3.eth.get_transaction_count,
+                    self.account.address,
+                    "pending",
+                )
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+    async def _wait_for_shutdown(self, timeout: float):
+        """Sleep for up to timeout seconds, returning early on shutdown"""
+        try:
+            await asyncio.wait_for(self._shutdown.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _wait_for_receipt(self, tx_hash):
+        """Block until tx_hash is mined, polling every RECEIPT_POLL_LATENCY"""
+        return self.web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+        )
+
     async def setup(self):
         """Setup the agent - register if needed"""
         if not self.is_registered:
             logger.info(f"Checking agent registration: {self.agent_address}")
             try:
                 if hasattr(self.registry, "register_agent"):
-                    tx_hash = self.registry.register_agent(self.agent_address)
-                    receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+                    tx_hash = await asyncio.to_thread(
+                        self.registry.register_agent, self.agent_address
+                    )
+                    receipt = await asyncio.to_thread(self._wait_for_receipt, tx_hash)
                     if receipt.status == 1:
                         logger.info("Agent registration successful")
                         self.is_registered = True
@@ -91,12 +186,19 @@ class AgentManager:
             except Exception as e:
                 logger.error(f"Error registering agent: {e}")
 
-    async def monitor_tasks(self, polling_interval: int = 10):
+    async def monitor_tasks(self, polling_interval: int = 10, num_workers: int = 4):
         """
         Monitor for new tasks and process them
 
+        The polling loop only discovers tasks; a pool of worker coroutines
+        consumes them from a bounded queue so slow LLM calls overlap.
+        The interval adapts to task arrival: it drops to MIN_POLLING_INTERVAL
+        after new tasks appear and doubles from polling_interval (up to
+        MAX_POLLING_INTERVAL) while the chain is idle.
+
         Args:
-            polling_interval: Seconds between polling for new tasks
+            polling_interval: Base seconds between polling for new tasks
+            num_workers: Number of tasks processed concurrently
         """
         logger.info(f"Starting task monitoring for agent {self.agent_address}")
 
@@ -104,22 +206,59 @@ class AgentManager:
         await self.setup()
 
         # Cache for processed tasks
-        processed_tasks = set()
+        processed_tasks = TaskIndexSet()
 
-        while True:
-            try:
-                # Get latest task number
-                latest_task = self.oracle.contract.functions.latestTaskNum().call()
-                logger.info(f"Latest task number: {latest_task}")
-
-                # Process all unprocessed tasks
-                for task_index in range(latest_task):
-                    if task_index in processed_tasks:
-                        continue
-
-                    # Check task status
-                    try:
-                        task_status = self.oracle.get_task_status(task_index)
+        # Every task index below the cursor has been processed
+        scan_cursor = 0
+
+        # Task arrival tracking for the adaptive polling interval
+        last_latest_task = None
+        idle_polls = 0
+        next_interval = polling_interval
+
+        # Tasks waiting for or being handled by a worker
+        queue: asyncio.Queue = asyncio.Queue(maxsize=TASK_QUEUE_SIZE)
+        queued = set()
+        workers = [
+            asyncio.create_task(self._task_worker(queue, queued, processed_tasks))
+            for _ in range(num_workers)
+        ]
+
+        self._shutdown = install_shutdown_event()
+
+        try:
+            while not self._shutdown.is_set():
+                try:
+                    # Get latest task number (RPCs run off the event loop)
+                    latest_task = await self.oracle.aget_latest_task_num()
+                    logger.info(f"Latest task number: {latest_task}")
+
+                    # Back off exponentially while idle, poll quickly when busy
+                    if latest_task == last_latest_task:
+                        next_interval = min(
+                            polling_interval * 2**idle_polls,
+                            max(MAX_POLLING_INTERVAL, polling_interval),
+                        )
+                        idle_polls = min(idle_polls + 1, 16)
+                    else:
+                        next_interval = MIN_POLLING_INTERVAL
+                        idle_polls = 0
+                    last_latest_task = latest_task
+
+                    # Fetch state of all unprocessed tasks in one aggregate call
+                    pending = [
+                        i
+                        for i in range(scan_cursor, latest_task)
+                        if i not in processed_tasks and i not in queued
+                    ]
+                    task_states = await self.oracle.aget_tasks_bulk(pending)
+
+                    # Hand all unprocessed tasks to the workers
+                    for task_index, task_state in zip(pending, task_states):
+                        if self._shutdown.is_set():
+                            break
+
+                        task_status = task_state["status"]
                         logger.info(f"Task {task_index} status: {task_status}")
 
                         # Skip if task is already resolved
@@ -127,38 +266,72 @@ class AgentManager:
                             processed_tasks.add(task_index)
                             continue
 
-                        # Process task
-                        await self.process_task(task_index, processed_tasks)
+                        # Skip if we already responded
+                        # Respondents come back lower-cased from the oracle
+                        if self._account_address_lc in task_state["respondents"]:
+                            logger.info(f"Already responded to task {task_index}")
+                            processed_tasks.add(task_index)
+                            continue
 
-                    except Exception as e:
-                        logger.error(f"Error checking task {task_index}: {e}")
+                        queued.add(task_index)
+                        await queue.put(task_index)
 
-                # Wait before next poll
-                await asyncio.sleep(polling_interval)
+                    # Skip the processed prefix on the next poll
+                    while scan_cursor < latest_task and scan_cursor in processed_tasks:
+                        scan_cursor += 1
 
-            except KeyboardInterrupt:
-                logger.info("\nExiting on user request")
-                break
-            except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                await asyncio.sleep(polling_interval)
+                except Exception as e:
+                    logger.error(f"Error in main loop: {e}")
+
+                # Wait before next poll, waking immediately on shutdown
+                await self._wait_for_shutdown(next_interval)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self.ai_backend:
+                await self.ai_backend.aclose()
+
+        logger.info("Shutdown requested, stopping task monitoring")
+
+    async def _task_worker(
+        self, queue: asyncio.Queue, queued: set, processed_tasks: TaskIndexSet
+    ):
+        """
+        Process task indices from the queue until cancelled
+
+        Args:
+            queue: Queue of task indices fed by monitor_tasks
+            queued: Indices currently queued or in progress
+            processed_tasks: Already processed task indices
+        """
+        while True:
+            task_index = await queue.get()
+            try:
+                await self.process_task(task_index, processed_tasks)
+            finally:
+                queued.discard(task_index)
+                queue.task_done()
 
-    async def process_task(self, task_index: int, processed_tasks: set):
+    async def process_task(self, task_index: int, processed_tasks: TaskIndexSet):
         """
         Process a specific task
 
         Args:
             task_index: Index of the task to process
-            processed_tasks: Set of already processed task indices
+            processed_tasks: Already processed task indices
         """
         logger.info(f"Processing task {task_index}")
 
         try:
-            # Get task data
-            task = self.oracle.reconstruct_task(task_index)
-
-            # Get task status
-            status = self.oracle.get_task_status(task_index)
+            # Get status and our on-chain response record concurrently,
+            # off the event loop
+            lookups = [self.oracle.aget_task_status(task_index)]
+            if self.account and task_index not in self._own_responded:
+                lookups.append(
+                    self.oracle.ahas_responded(task_index, self.account.address)
+                )
+            status, *responded = await asyncio.gather(*lookups)
 
             # Only process if not resolved
             if status == TaskStatus.RESOLVED:
@@ -166,26 +339,37 @@ class AgentManager:
                 processed_tasks.add(task_index)
                 return
 
-            # Get task responders
-            respondents = self.oracle.get_task_respondents(task_index)
-            agent_address = self.account.address.lower()
-
-            # Check if we already responded
-            if agent_address in [r.lower() for r in respondents]:
+            # Check if we already responded, locally or via hasResponded
+            if task_index in self._own_responded or any(responded):
                 logger.info(f"Already responded to task {task_index}, skipping")
                 processed_tasks.add(task_index)
                 return
 
+            # Only reconstruct the task once we know it needs an answer
+            task = await self.oracle.areconstruct_task(task_index)
+
             # Generate AI response
             query = task.get("name", "")
             logger.info(f"Generating response for task: {query}")
 
             # Get AI response
-            response = self.get_ai_response(task)
+            response = await self.get_ai_response_async(task)
 
             # Submit response to blockchain
             if self.private_key:
-                self.submit_response(task_index, task, response)
+                # Nonces come from the local counter so workers don't collide
+                nonce = await self._next_nonce()
+                try:
+                    await asyncio.to_thread(
+                        self.submit_response, task_index, task, response, nonce
+                    )
+                except Exception as e:
+                    # Resync only if the nonce was never used; after a
+                    # broadcast, other workers' later nonces are still valid
+                    if _nonce_needs_resync(e):
+                        async with self._nonce_lock:
+                            self._nonce = None
+                    raise
                 logger.info(f"Submitted response for task {task_index}")
             else:
                 logger.info(f"Would submit response for task {task_index}: {response}")
@@ -197,104 +381,28 @@ class AgentManager:
         except Exception as e:
             logger.error(f"Error processing task {task_index}: {e}")
 
-    def get_ai_response(self, task: Dict[str, Any]) -> str:
+    async def get_ai_response_async(self, task: Dict[str, Any]) -> str:
         """
         Use AI agent to generate a response in JSON format and parse it.
 
+        The request goes through the backend's shared aiohttp session.
+
         Args:
             task: Task data
 
         Returns:
             Response string ("YES" or "NO")
         """
-        task_content = task.get("name", "")
-
-        prompt = f"""
-        You are evaluating a prediction market question.
-        Your task is to respond with a JSON object containing two keys:
-        1. "decision": Must be either "YES" or "NO" (uppercase).
-        2. "explanation": A brief explanation of your reasoning.
-
-        Question: {task_content}
-
-        Respond ONLY with the JSON object, nothing else.
-        Example JSON response:
-        {{
-          "decision": "YES",
-          "explanation": "Based on current market trends and analyst projections."
-        }}
-        """
+        prompt = f"Question: {task.get('name', '')}"
 
         decision = "NO"  # Default decision if parsing fails
 
         # Call AI agent if available or use mock response for testing
         if self.ai_backend:
             try:
-                full_response_str = self.ai_backend.generate_response(prompt)
+                full_response_str = await self._astream_ai_response(prompt)
                 logger.info(f"Raw AI response string: {full_response_str}")
-
-                # Attempt to parse the JSON response
-                try:
-                    # Find the JSON block in case the LLM adds extra text
-                    json_start = full_response_str.find("{")
-                    json_end = full_response_str.rfind("}")
-                    if json_start != -1 and json_end != -1 and json_end > json_start:
-                        json_str = full_response_str[json_start : json_end + 1]
-                        parsed_response = json.loads(json_str)
-
-                        # Validate the parsed JSON
-                        is_dict = isinstance(parsed_response, dict)
-                        has_decision = "decision" in parsed_response
-                        if is_dict and has_decision:
-                            extracted_decision = (
-                                parsed_response["decision"].strip().upper()
-                            )
-                            if extracted_decision in ["YES", "NO"]:
-                                decision = extracted_decision
-                                explanation = parsed_response.get(
-                                    "explanation", "(No explanation provided)"
-                                )
-                                log_info_msg = (
-                                    f"Parsed AI Decision: {decision}, "
-                                    f"Explanation: {explanation}"
-                                )
-                                logger.info(log_info_msg)
-                            else:
-                                log_msg = (
-                                    "Parsed JSON 'decision' has invalid value: "
-                                    f"{parsed_response['decision']}. "
-                                    "Defaulting to NO."
-                                )
-                                logger.warning(log_msg)
-                        else:
-                            log_msg = (
-                                "Parsed JSON is not a dictionary or missing "
-                                "'decision' key: {parsed_response}. "
-                                "Defaulting to NO."
-                            )
-                            logger.warning(log_msg)
-                    else:
-                        log_msg = (
-                            "Could not find valid JSON block in response: "
-                            f"{full_response_str}. Defaulting to NO."
-                        )
-                        logger.warning(log_msg)
-
-                except json.JSONDecodeError as e:
-                    log_msg = (
-                        "Failed to decode JSON from AI response: "
-                        f"{e}. Raw response: {full_response_str}. "
-                        "Defaulting to NO."
-                    )
-                    logger.warning(log_msg)
-                except Exception as e:
-                    log_msg = (
-                        "Unexpected error parsing AI response JSON: "
-                        f"{e}. Raw response: {full_response_str}. "
-                        "Defaulting to NO."
-                    )
-                    logger.error(log_msg)
-
+                decision = self._parse_ai_response(full_response_str)
             except Exception as e:
                 logger.error(f"Error calling AI backend: {e}. Defaulting to NO.")
 
@@ -309,7 +417,114 @@ class AgentManager:
         logger.info(final_log_msg)
         return decision
 
-    def submit_response(self, task_index: int, task: Dict[str, Any], response: str):
+    async def _astream_ai_response(self, prompt: str) -> str:
+        """
+        Stream the AI response, closing the stream once the decision is known
+
+        Args:
+            prompt: Prompt to send to the AI backend
+
+        Returns:
+            Response text received so far (may be truncated after the decision)
+        """
+        full_response_str = ""
+        async with aclosing(
+            self.ai_backend.astream_response(prompt, self._system_prompt)
+        ) as chunks:
+            async for chunk in chunks:
+                full_response_str += chunk
+                if DECISION_PATTERN.search(full_response_str):
+                    # aclosing() releases the HTTP stream on early exit
+                    break
+        return full_response_str
+
+    def _parse_ai_response(self, full_response_str: str) -> str:
+        """
+        Extract the YES/NO decision from a raw AI response.
+
+        Args:
+            full_response_str: Raw (possibly truncated) response text
+
+        Returns:
+            Response string ("YES" or "NO"), defaulting to NO
+        """
+        # Streamed responses stop right after the decision field
+        match = DECISION_PATTERN.search(full_response_str)
+        if match:
+            decision = match.group(1).upper()
+            logger.info(f"Parsed AI Decision: {decision}")
+            return decision
+
+        # Attempt to parse the JSON response
+        try:
+            # Find the JSON block in case the LLM adds extra text
+            json_start = full_response_str.find("{")
+            json_end = full_response_str.rfind("}")
+            if json_start == -1 or json_end == -1 or json_end <= json_start:
+                log_msg = (
+                    "Could not find valid JSON block in response: "
+                    f"{full_response_str}. Defaulting to NO."
+                )
+                logger.warning(log_msg)
+                return "NO"
+
+            json_str = full_response_str[json_start : json_end + 1]
+            parsed_response = json.loads(json_str)
+
+            # Validate the parsed JSON
+            is_dict = isinstance(parsed_response, dict)
+            if not is_dict or "decision" not in parsed_response:
+                log_msg = (
+                    "Parsed JSON is not a dictionary or missing "
+                    f"'decision' key: {parsed_response}. "
+                    "Defaulting to NO."
+                )
+                logger.warning(log_msg)
+                return "NO"
+
+            extracted_decision = parsed_response["decision"].strip().upper()
+            if extracted_decision not in ["YES", "NO"]:
+                log_msg = (
+                    "Parsed JSON 'decision' has invalid value: "
+                    f"{parsed_response['decision']}. "
+                    "Defaulting to NO."
+                )
+                logger.warning(log_msg)
+                return "NO"
+
+            explanation = parsed_response.get(
+                "explanation", "(No explanation provided)"
+            )
+            logger.info(
+                f"Parsed AI Decision: {extracted_decision}, "
+                f"Explanation: {explanation}"
+            )
+            return extracted_decision
+
+        except json.JSONDecodeError as e:
+            log_msg = (
+                "Failed to decode JSON from AI response: "
+                f"{e}. Raw response: {full_response_str}. "
+                "Defaulting to NO."
+            )
+            logger.warning(log_msg)
+        except Exception as e:
+            log_msg = (
+                "Unexpected error parsing AI response JSON: "
+                f"{e}. Raw response: {full_response_str}. "
+                "Defaulting to NO."
+            )
+            logger.error(log_msg)
+
+        return "NO"
+
+    def submit_response(
+        self,
+        task_index: int,
+        task: Dict[str, Any],
+        response: str,
+        nonce: Optional[int] = None,
+    ):
         """
         Submit response via AIAgent contract.
         Calls the updated processTask(uint32, bool) function.
@@ -318,6 +533,7 @@ class AgentManager:
             task_index: Task index
             task: Task data (currently unused in this version)
             response: Response string ("YES" or "NO")
+            nonce: Transaction nonce, fetched from the chain if not given
         """
         if not self.account:
             raise ValueError("Cannot submit response without a private key")
@@ -331,12 +547,13 @@ class AgentManager:
         # Submit to blockchain via the AIAgent contract's updated function
         try:
             # Call processTask(uint32 taskIndex, bool decision)
-            tx_hash = self.agent.process_task(task_index, is_yes_decision)
+            tx_hash = self.agent.process_task(task_index, is_yes_decision, nonce)
 
             # Wait for receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = self._wait_for_receipt(tx_hash)
 
             if receipt["status"] == 1:
+                self._own_responded.add(task_index)
                 logger.info(f"Response submitted successfully via AIAgent: {tx_hash}")
             else:
                 logger.error(f"Response submission via AIAgent failed: {receipt}")
@@ -0,0 +1,58 @@
+"""Client for batching contract reads through Multicall3"""
+
+from typing import List, Sequence, Tuple
+
+from web3 import Web3
+
+from .utils import load_abi
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Sub-calls per aggregate3 eth_call, to stay within node gas and response limits
+MAX_CALLS_PER_AGGREGATE = 500
+
+
+class Multicall:
+    """Client for the Multicall3 aggregator contract"""
+
+    def __init__(self, web3: Web3, contract_address: str = MULTICALL3_ADDRESS):
+        """
+        Initialize the Multicall3 client
+
+        Args:
+            web3: Web3 instance
+            contract_address: Address of the Multicall3 contract
+        """
+        self.web3 = web3
+        self.address = Web3.to_checksum_address(contract_address)
+
+        # Load contract ABI
+        self.abi = load_abi("Multicall3.json")
+        self.contract = self.web3.eth.contract(address=self.address, abi=self.abi)
+
+    def aggregate(
+        self, calls: Sequence[Tuple[str, bytes]], allow_failure: bool = True
+    ) -> List[Tuple[bool, bytes]]:
+        """
+        Execute several read-only calls in a single eth_call
+
+        Calls beyond MAX_CALLS_PER_AGGREGATE are split across several
+        eth_calls.
+
+        Args:
+            calls: (target address, calldata) pairs
+            allow_failure: Return failed sub-calls instead of reverting the batch
+
+        Returns:
+            (success, return data) for each call, in order
+        """
+        if not calls:
+            return []
+
+        call3 = [(target, allow_failure, call_data) for target, call_data in calls]
+        results: List[Tuple[bool, bytes]] = []
+        for start in range(0, len(call3), MAX_CALLS_PER_AGGREGATE):
+            chunk = call3[start : start + MAX_CALLS_PER_AGGREGATE]
+            results.extend(self.contract.functions.aggregate3(chunk).call())
+        return results
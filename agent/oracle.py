@@ -1,11 +1,73 @@
+import asyncio
+import threading
+import time
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+from eth_abi import decode
+from eth_utils.abi import get_abi_output_types
+from hexbytes import HexBytes
 from loguru import logger
 from pydantic import BaseModel
+from requests.exceptions import HTTPError, RequestException
 from web3 import Web3
-
-from .utils import load_abi
+from web3.exceptions import BadFunctionCallOutput, ProviderConnectionError
+
+from .multicall import Multicall
+from .utils import checksum_address, load_abi
+
+# Task getters in order of preference; both return (name, taskCreatedBlock)
+TASK_GETTERS = ("getTask", "allTasks")
+
+# createNewTask sends between gas re-estimates for the same name size
+CREATE_TASK_GAS_REESTIMATE = 50
+
+# JSON-RPC error code for methods the node does not implement
+METHOD_NOT_FOUND = -32601
+
+# Block span of each eth_getLogs request when scanning for task events
+LOG_CHUNK_SIZE = 5000
+
+# Errors from the node connection itself, as opposed to the contract call
+TRANSPORT_ERRORS = (
+    RequestException,
+    ProviderConnectionError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# Precomputed 4-byte selectors for the hot view calls
+LATEST_TASK_NUM_SELECTOR = Web3.keccak(text="latestTaskNum()")[:4]
+TASK_STATUS_SELECTOR = Web3.keccak(text="taskStatus(uint32)")[:4]
+TASK_RESPONDENTS_SELECTOR = Web3.keccak(text="taskRespondents(uint32)")[:4]
+TASK_HASH_SELECTOR = Web3.keccak(text="allTaskHashes(uint32)")[:4]
+HAS_RESPONDED_SELECTOR = Web3.keccak(text="hasResponded(uint32,address)")[:4]
+CONSENSUS_RESULT_SELECTOR = Web3.keccak(text="getConsensusResult(uint32)")[:4]
+
+# topics[0] of NewTaskCreated(uint32 indexed taskIndex, Task task)
+NEW_TASK_CREATED_TOPIC = Web3.keccak(text="NewTaskCreated(uint32,(string,uint32))")
+
+
+def decode_address_array(data: bytes) -> List[str]:
+    """
+    Decode a lone ABI-encoded address[] return value
+
+    Slices the 32-byte words directly and returns lower-case hex strings,
+    skipping per-address checksumming; callers that display addresses can
+    checksum them on demand.
+    """
+    if len(data) < 64:
+        raise BadFunctionCallOutput(f"Could not decode address[] from {data!r}")
+    offset = int.from_bytes(data[:32], "big")
+    length = int.from_bytes(data[offset : offset + 32], "big")
+    start = offset + 32
+    if len(data) < start + 32 * length:
+        raise BadFunctionCallOutput(f"Truncated address[] return data: {data!r}")
+    return [
+        "0x" + data[start + 32 * i + 12 : start + 32 * (i + 1)].hex()
+        for i in range(length)
+    ]
 
 
 class TaskStatus(IntEnum):
@@ -23,7 +85,11 @@ class Oracle:
     """Client for interacting with the AIOracleServiceManager contract"""
 
     def __init__(
-        self, web3: Web3, contract_address: str, private_key: Optional[str] = None
+        self,
+        web3: Web3,
+        contract_address: str,
+        private_key: Optional[str] = None,
+        deployment_block: int = 0,
     ):
         """
         Initialize the AIOracle client
@@ -32,6 +98,8 @@ class Oracle:
             web3: Web3 instance
             contract_address: Address of the AIOracleServiceManager contract
             private_key: Private key for signing transactions (optional)
+            deployment_block: Block the contract was deployed in, where
+                NewTaskCreated log scans start
         """
         self.web3 = web3
         self.address = Web3.to_checksum_address(contract_address)
@@ -41,46 +109,259 @@ class Oracle:
         self.abi = load_abi("AIOracleServiceManager.json")
         self.contract = self.web3.eth.contract(address=self.address, abi=self.abi)
 
+        # Aggregator for bulk view calls
+        self.multicall = Multicall(web3)
+
+        # Pick the task getter once from the ABI rather than probing per call.
+        # getTask returns the Task struct; allTasks is the public mapping getter.
+        abi_functions = {
+            entry.get("name") for entry in self.abi if entry.get("type") == "function"
+        }
+        self._task_getter = next(
+            (name for name in TASK_GETTERS if name in abi_functions), None
+        )
+        self._task_getter_fn = (
+            self.contract.get_function_by_name(self._task_getter)
+            if self._task_getter
+            else None
+        )
+
+        # Raw calldata prefix and return types of the getter, for multicall
+        if self._task_getter:
+            self._task_getter_selector = Web3.keccak(
+                text=f"{self._task_getter}(uint32)"
+            )[:4]
+            self._task_getter_output_types = get_abi_output_types(
+                self._task_getter_fn.abi
+            )
+
+        # Locally tracked next nonce; None means resync from the chain
+        self._local_nonce: Optional[int] = None
+        self._nonce_lock = threading.Lock()
+
+        # ABI-encoded createNewTask calldata for recently used names
+        self._create_task_calldata = lru_cache(maxsize=128)(
+            lambda name: self.contract.encode_abi("createNewTask", args=[name])
+        )
+
+        # createNewTask gas estimates by name size in 32-byte words,
+        # as (estimated gas, sends since the estimate)
+        self._create_task_gas: Dict[int, Tuple[int, int]] = {}
+
+        # Whether Multicall3 is deployed on this chain; None until checked
+        self._multicall_supported: Optional[bool] = None
+
+        # Cleared once the node rejects eth_sendRawTransactionSync
+        self._send_sync_supported = True
+
+        # Last latestTaskNum reading as (monotonic time, value)
+        self._task_num_cache: Optional[Tuple[float, int]] = None
+
+        # Tasks seen in NewTaskCreated logs, and the next block to scan
+        self._task_event_cache: Dict[int, Dict[str, Any]] = {}
+        self._event_scanned_to = deployment_block
+
         # Set up account if private key is provided
         self.account = None
         if private_key:
             self.account = self.web3.eth.account.from_key(private_key)
 
-    def get_optimal_gas_price(self):
-        """Get optimal gas price based on recent blocks"""
-        # Get gas prices from last few blocks
-        gas_prices = []
-        latest_block = self.web3.eth.block_number
+    def get_fee_estimate(self, percentile: int = 60) -> Tuple[int, int]:
+        """
+        Get the pending block's base fee and a priority fee via eth_feeHistory
 
-        # Sample gas prices from recent transactions
-        for i in range(5):  # Only check last 5 blocks
-            if latest_block - i >= 0:
-                block = self.web3.eth.get_block(latest_block - i, True)
-                for tx in block.transactions[:5]:  # Limit to 5 transactions per block
-                    if hasattr(tx, "gasPrice"):
-                        gas_prices.append(tx.gasPrice)
+        Args:
+            percentile: Reward percentile of recent transactions to target
 
-        if not gas_prices:
+        Returns:
+            Tuple of (base fee, priority fee) in wei
+        """
+        # One small RPC instead of downloading full blocks
+        fee_history = self.web3.eth.fee_history(5, "latest", [percentile])
+        return self._fee_estimate_from_history(fee_history)
+
+    @staticmethod
+    def _fee_estimate_from_history(fee_history) -> Tuple[int, int]:
+        """Reduce an eth_feeHistory result to (next base fee, median reward)"""
+        # The last base fee entry is for the next (pending) block
+        base_fee = fee_history["baseFeePerGas"][-1]
+        rewards = sorted(reward[0] for reward in fee_history["reward"] if reward)
+        priority_fee = rewards[len(rewards) // 2] if rewards else 0
+        return base_fee, priority_fee
+
+    def get_optimal_gas_price(self):
+        """Get optimal gas price based on the fee history of recent blocks"""
+        # Use a higher percentile for more urgent transactions (60th instead of 30th)
+        base_fee, priority_fee = self.get_fee_estimate(60)
+
+        if not priority_fee:
             # Add 20% to the network's suggested gas price if no historical data
             return int(self.web3.eth.gas_price * 1.2)
 
-        # Use a higher percentile for more urgent transactions (60th instead of 30th)
-        gas_prices.sort()
-        index = int(len(gas_prices) * 0.6)  # 60th percentile
-        return gas_prices[index]
+        return base_fee + priority_fee
 
-    def create_task(self, name: str) -> Tuple[str, int]:
+    def _multicall_available(self) -> bool:
+        """Check once whether the Multicall3 contract exists on this chain"""
+        if self._multicall_supported is None:
+            try:
+                code = self.web3.eth.get_code(self.multicall.address)
+            except Exception as e:
+                # Not remembered, so the next bulk read checks again
+                logger.warning(f"Could not check for Multicall3: {e}")
+                return False
+            self._multicall_supported = len(code) > 0
+            if not self._multicall_supported:
+                logger.info("No Multicall3 contract on this chain, using single calls")
+        return self._multicall_supported
+
+    def _next_nonce(self) -> int:
         """
-        Create a new task in the oracle
+        Hand out the next nonce for this account from a local counter
+
+        The counter is seeded from the pending transaction count on first
+        use, so sequential sends skip eth_getTransactionCount.
+        """
+        with self._nonce_lock:
+            if self._local_nonce is None:
+                self._local_nonce = self.web3.eth.get_transaction_count(
+                    self.account.address, "pending"
+                )
+            nonce = self._local_nonce
+            self._local_nonce += 1
+            return nonce
+
+    def _send_and_wait(self, raw_transaction: bytes) -> Tuple[HexBytes, Any]:
+        """
+        Send a signed transaction and wait for its receipt
+
+        Uses eth_sendRawTransactionSync (EIP-7966) when the node supports it,
+        so inclusion is reported in the send response instead of by polling.
+        Nodes that lack the method (a -32601 error or an HTTP 4xx response)
+        are remembered and get send + receipt polling. Any other error is
+        raised, since the transaction may already have been broadcast;
+        if the error names the transaction hash, its receipt is awaited
+        instead.
+
+        Args:
+            raw_transaction: Signed transaction bytes
+
+        Returns:
+            Tuple of (transaction hash, receipt)
+        """
+        if self._send_sync_supported:
+            try:
+                response = self.web3.provider.make_request(
+                    "eth_sendRawTransactionSync", [Web3.to_hex(raw_transaction)]
+                )
+            except HTTPError as e:
+                # Gateways reject unknown methods with a 4xx before the
+                # transaction reaches the node; 429 is only rate limiting
+                status = e.response.status_code if e.response is not None else 0
+                if not 400 <= status < 500 or status == 429:
+                    raise
+                error = {"message": str(e)}
+            else:
+                error = response.get("error")
+                if error is None:
+                    tx_hash = HexBytes(response["result"]["transactionHash"])
+                    # The node has the receipt already; fetch it in web3's format
+                    return tx_hash, self.web3.eth.get_transaction_receipt(tx_hash)
+                if error.get("code") != METHOD_NOT_FOUND:
+                    tx_hash = self._error_tx_hash(error)
+                    if tx_hash is None:
+                        raise ValueError(f"eth_sendRawTransactionSync failed: {error}")
+                    # e.g. the EIP-7966 timeout: sent, but not mined in time
+                    logger.warning(f"Sync send returned {error}, awaiting receipt")
+                    return tx_hash, self.web3.eth.wait_for_transaction_receipt(tx_hash)
+
+            logger.info(
+                f"eth_sendRawTransactionSync unavailable ({error}), polling receipts"
+            )
+            self._send_sync_supported = False
+
+        tx_hash = self.web3.eth.send_raw_transaction(raw_transaction)
+        return tx_hash, self.web3.eth.wait_for_transaction_receipt(tx_hash)
+
+    @staticmethod
+    def _error_tx_hash(error: Dict[str, Any]) -> Optional[HexBytes]:
+        """Transaction hash carried in a JSON-RPC error's data, if any"""
+        data = error.get("data")
+        if isinstance(data, dict):
+            data = data.get("transactionHash") or data.get("txHash")
+        if isinstance(data, str) and len(data) == 66 and data.startswith("0x"):
+            return HexBytes(data)
+        return None
+
+    def _create_task_tx(self, name: str, nonce: int, gas_limit: int) -> Dict[str, Any]:
+        """
+        Fee-less createNewTask transaction fields, without build_transaction
+
+        Calldata comes from the per-name cache and the chain ID from the
+        provider's request cache, so no ABI encoding or RPC happens here
+        for repeated names.
+        """
+        return {
+            "from": self.account.address,
+            "to": self.address,
+            "data": self._create_task_calldata(name),
+            "value": 0,
+            "nonce": nonce,
+            "gas": gas_limit,
+            "chainId": self.web3.eth.chain_id,
+        }
+
+    def _estimate_create_task_gas(self, name: str) -> int:
+        """
+        Estimate the gas createNewTask needs for a task name
+
+        Gas grows with the number of 32-byte words the name occupies, so
+        estimates are cached per word count and reused for
+        CREATE_TASK_GAS_REESTIMATE sends before estimate_gas runs again.
 
         Args:
             name: Task name
 
         Returns:
-            Tuple of (transaction hash, task index)
+            Estimated gas, without a safety buffer
         """
-        if not self.account:
-            raise ValueError("Private key not provided, cannot send transactions")
+        words = (len(name.encode("utf-8")) + 31) // 32
+        cached = self._create_task_gas.get(words)
+        if cached is not None and cached[1] < CREATE_TASK_GAS_REESTIMATE:
+            self._create_task_gas[words] = (cached[0], cached[1] + 1)
+            return cached[0]
+
+        estimated_gas = self.contract.functions.createNewTask(name).estimate_gas(
+            {"from": self.account.address}
+        )
+        self._create_task_gas[words] = (estimated_gas, 1)
+        return estimated_gas
+
+    def _record_create_task_gas(self, name: str, gas_used: int):
+        """Raise the cached createNewTask estimate to the gas actually used"""
+        words = (len(name.encode("utf-8")) + 31) // 32
+        cached = self._create_task_gas.get(words)
+        if cached is not None and gas_used > cached[0]:
+            self._create_task_gas[words] = (gas_used, cached[1])
+
+    def _create_task_context(self) -> Tuple[int, Optional[int], int]:
+        """
+        Fetch the state create_task needs before building its transaction
+
+        The independent reads go out as one JSON-RPC batch; if the
+        provider rejects batching they are made one by one.
+
+        Returns:
+            Tuple of (latest task number, base fee or None, gas price)
+        """
+        try:
+            with self.web3.batch_requests() as batch:
+                batch.add(self.contract.functions.latestTaskNum())
+                batch.add(self.web3.eth.fee_history(5, "latest", [60]))
+                current_task_num, fee_history = batch.execute()
+            base_fee, priority_fee = self._fee_estimate_from_history(fee_history)
+            return current_task_num, base_fee, base_fee + priority_fee
+        except Exception as e:
+            logger.warning(f"Batched task setup failed, querying one by one: {e}")
 
         # Try to get current task number, but don't fail if this doesn't work
         current_task_num = 0
@@ -90,42 +371,61 @@ class Oracle:
             print(f"Warning: Could not get latest task number: {e}")
             print("Proceeding with task creation anyway...")
 
+        # Fetch fee data for both transaction styles in one RPC
+        base_fee = None
+        try:
+            base_fee, priority_fee = self.get_fee_estimate(60)
+            gas_price = base_fee + priority_fee
+        except Exception as e:
+            logger.warning(f"Could not get optimal gas price: {e}")
+            gas_price = self.web3.eth.gas_price
+
+        return current_task_num, base_fee, gas_price
+
+    def create_task(self, name: str) -> Tuple[str, int]:
+        """
+        Create a new task in the oracle
+
+        Args:
+            name: Task name
+
+        Returns:
+            Tuple of (transaction hash, task index)
+        """
+        if not self.account:
+            raise ValueError("Private key not provided, cannot send transactions")
+
         # Create transaction
         try:
-            # Try to get optimal gas price
-            try:
-                gas_price = self.get_optimal_gas_price()
-            except Exception as e:
-                logger.warning(f"Could not get optimal gas price: {e}")
-                gas_price = self.web3.eth.gas_price
+            # Task number and fee data in one JSON-RPC batch
+            current_task_num, base_fee, gas_price = self._create_task_context()
+            nonce = self._next_nonce()
 
-            nonce = self.web3.eth.get_transaction_count(self.account.address, "pending")
+            # Estimate gas once for whichever transaction style is used
+            try:
+                estimated_gas = self._estimate_create_task_gas(name)
+            except Exception as e_gas:
+                logger.warning(f"Gas estimation failed: {e_gas}, using safe default")
+                estimated_gas = None
 
             # Try EIP-1559 transaction style
             try:
-                # Get base fee from latest block
-                latest_block = self.web3.eth.get_block("latest")
-                base_fee = latest_block.baseFeePerGas
+                # No eth_feeHistory means no EIP-1559 support worth probing
+                if base_fee is None:
+                    raise ValueError("no base fee available")
+                if estimated_gas is None:
+                    raise ValueError("no gas estimate available")
                 max_priority_fee = self.web3.to_wei(1, "gwei")
                 max_fee_per_gas = int(base_fee * 1.5) + max_priority_fee
-
-                # Estimate gas with buffer
-                estimated_gas = self.contract.functions.createNewTask(
-                    name
-                ).estimate_gas({"from": self.account.address})
                 gas_limit = int(estimated_gas * 1.2)  # 20% buffer
 
                 # Build EIP-1559 transaction
-                tx = self.contract.functions.createNewTask(name).build_transaction(
-                    {
-                        "from": self.account.address,
-                        "nonce": nonce,
-                        "gas": gas_limit,
-                        "maxFeePerGas": max_fee_per_gas,
-                        "maxPriorityFeePerGas": max_priority_fee,
-                        "type": 2,  # EIP-1559 transaction
-                    }
-                )
+                tx = {
+                    **self._create_task_tx(name, nonce, gas_limit),
+                    "maxFeePerGas": max_fee_per_gas,
+                    "maxPriorityFeePerGas": max_priority_fee,
+                    "type": 2,  # EIP-1559 transaction
+                }
             except Exception as e:
                 # Fallback to legacy transaction type
                 logger.warning(
@@ -133,67 +433,261 @@ class Oracle:
                     " falling back to legacy"
                 )
 
-                # Estimate gas with buffer
-                try:
-                    estimated_gas = self.contract.functions.createNewTask(
-                        name
-                    ).estimate_gas({"from": self.account.address})
+                if estimated_gas is not None:
                     gas_limit = int(estimated_gas * 1.5)  # Increase buffer to 50%
-                except Exception as e_gas:
-                    logger.warning(
-                        f"Gas estimation failed: {e_gas}, using safe default"
-                    )
+                else:
                     gas_limit = 300000  # Increased from 300000 to be much safer
 
                 # Build legacy transaction
-                tx = self.contract.functions.createNewTask(name).build_transaction(
-                    {
-                        "from": self.account.address,
-                        "nonce": nonce,
-                        "gas": gas_limit,
-                        "gasPrice": gas_price * 1.2,  # Add 20% to gas price
-                    }
-                )
-
-            signed_tx = self.web3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                tx = {
+                    **self._create_task_tx(name, nonce, gas_limit),
+                    "gasPrice": int(gas_price * 1.2),  # Add 20% to gas price
+                }
 
-            # Wait for transaction receipt to get task ID from logs
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            signed_tx = self.account.sign_transaction(tx)
+            # Send and wait for the receipt to get task ID from logs
+            tx_hash, receipt = self._send_and_wait(signed_tx.raw_transaction)
+            self._record_create_task_gas(name, receipt["gasUsed"])
 
             # Try to get task ID from logs
             try:
-                logs = self.contract.events.NewTaskCreated().process_receipt(receipt)
-                if logs:
+                task_index = self._task_index_from_receipt(receipt)
+                if task_index is not None:
                     # Update current_task_num if we got it from logs
-                    current_task_num = logs[0]["args"]["taskIndex"]
+                    current_task_num = task_index
+                    # Our own task bumped latestTaskNum; no need to re-read it
+                    self._task_num_cache = (time.monotonic(), current_task_num + 1)
             except Exception as e:
                 print(f"Warning: Could not extract task ID from logs: {e}")
 
             return tx_hash.hex(), current_task_num
         except Exception as e:
+            # The nonce may be stale or unused; resync on the next send
+            self._local_nonce = None
             raise ValueError(f"Failed to create task: {e}")
 
+    def _call_view(self, selector: bytes, *words: bytes) -> bytes:
+        """
+        eth_call a view function with precomputed calldata
+
+        Skips building a ContractFunction and re-encoding the selector,
+        which dominates the cost of the small per-task reads.
+
+        Args:
+            selector: 4-byte function selector
+            words: ABI-encoded 32-byte static arguments
+
+        Returns:
+            Raw return data
+
+        Raises:
+            BadFunctionCallOutput: If the call returned less than one word,
+                e.g. because there is no contract at the address
+        """
+        result = self.web3.eth.call(
+            {"to": self.address, "data": selector + b"".join(words)}
+        )
+        if len(result) < 32:
+            raise BadFunctionCallOutput(
+                f"Could not decode output of {selector.hex()} at {self.address}: "
+                f"{result!r}"
+            )
+        return result
+
+    def get_latest_task_num(self, max_age: float = 0) -> int:
+        """
+        Get the number of tasks created so far
+
+        Args:
+            max_age: Seconds a previous reading may be reused for instead of
+                calling the contract; 0 always queries
+
+        Returns:
+            Latest task number
+        """
+        cached = self._task_num_cache
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        task_num = int.from_bytes(self._call_view(LATEST_TASK_NUM_SELECTOR), "big")
+        self._task_num_cache = (time.monotonic(), task_num)
+        return task_num
+
+    def _task_index_from_receipt(self, receipt) -> Optional[int]:
+        """
+        Read the task index from a receipt's NewTaskCreated log
+
+        taskIndex is the first indexed topic, so the log data (the task
+        struct) never needs ABI decoding.
+        """
+        for log in receipt["logs"]:
+            topics = log["topics"]
+            if (
+                log["address"] == self.address
+                and topics
+                and topics[0] == NEW_TASK_CREATED_TOPIC
+            ):
+                return int.from_bytes(topics[1], "big")
+        return None
+
     def get_task_status(self, task_index: int) -> TaskStatus:
         """Get the status of a task"""
-        status_value = self.contract.functions.taskStatus(task_index).call()
-        return TaskStatus(status_value)
+        return self.fast_task_status(task_index)
+
+    def fast_task_status(self, task_index: int) -> TaskStatus:
+        """
+        Get the status of a task with a raw eth_call
+
+        Uses precomputed calldata instead of building a ContractFunction,
+        for use inside polling loops.
+        """
+        result = self._call_view(TASK_STATUS_SELECTOR, task_index.to_bytes(32, "big"))
+        return TaskStatus(int.from_bytes(result, "big"))
+
+    def get_task_statuses(self, task_indices: List[int]) -> List[TaskStatus]:
+        """
+        Get the statuses of several tasks in a single JSON-RPC batch
+
+        Falls back to one call per task if the provider rejects batching.
+
+        Args:
+            task_indices: Indices of the tasks to query
+
+        Returns:
+            Task statuses in the same order as task_indices
+        """
+        if not task_indices:
+            return []
+
+        try:
+            with self.web3.batch_requests() as batch:
+                for task_index in task_indices:
+                    batch.add(self.contract.functions.taskStatus(task_index))
+                status_values = batch.execute()
+        except Exception as e:
+            logger.warning(f"Batched status lookup failed, querying one by one: {e}")
+            return [self.fast_task_status(task_index) for task_index in task_indices]
+
+        return [TaskStatus(status_value) for status_value in status_values]
 
     def get_task_respondents(self, task_index: int) -> List[str]:
-        """Get the addresses of all respondents for a task"""
-        return self.contract.functions.taskRespondents(task_index).call()
+        """Get the addresses of all respondents for a task, lower-cased"""
+        result = self._call_view(
+            TASK_RESPONDENTS_SELECTOR, task_index.to_bytes(32, "big")
+        )
+        return decode_address_array(result)
+
+    def get_tasks_bulk(
+        self, task_indices: List[int], include_consensus: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get status, respondents and hash of several tasks in one Multicall3 call
+
+        Falls back to individual calls if Multicall3 is unavailable.
+
+        Args:
+            task_indices: Indices of the tasks to query
+            include_consensus: Also fetch getConsensusResult for each task
+
+        Returns:
+            Dictionaries with 'status', 'respondents' and 'task_hash' (plus
+            'consensus', None if the task has none yet), in the same order
+            as task_indices
+        """
+        if not task_indices:
+            return []
+
+        selectors = [
+            TASK_STATUS_SELECTOR,
+            TASK_RESPONDENTS_SELECTOR,
+            TASK_HASH_SELECTOR,
+        ]
+        if include_consensus:
+            selectors.append(CONSENSUS_RESULT_SELECTOR)
+
+        if not self._multicall_available():
+            return self._get_tasks_individually(task_indices, include_consensus)
+
+        try:
+            calls = [
+                (self.address, selector + task_index.to_bytes(32, "big"))
+                for task_index in task_indices
+                for selector in selectors
+            ]
+            # getConsensusResult reverts until consensus is reached, so let
+            # sub-calls fail individually and check the required ones below
+            results = self.multicall.aggregate(calls, allow_failure=include_consensus)
+
+            tasks = []
+            for offset in range(0, len(results), len(selectors)):
+                group = results[offset : offset + len(selectors)]
+                if not all(success for success, _ in group[:3]):
+                    raise ValueError("task view call failed")
+
+                status_data, respondents_data, hash_data = (
+                    return_data for _, return_data in group[:3]
+                )
+                task = {
+                    "status": TaskStatus(decode(["uint8"], status_data)[0]),
+                    "respondents": decode_address_array(respondents_data),
+                    "task_hash": decode(["bytes32"], hash_data)[0],
+                }
+                if include_consensus:
+                    success, consensus_data = group[3]
+                    task["consensus"] = (
+                        tuple(decode(["bytes", "bool"], consensus_data))
+                        if success
+                        else None
+                    )
+                tasks.append(task)
+            return tasks
+        except Exception as e:
+            logger.warning(f"Multicall task lookup failed, querying one by one: {e}")
+
+        return self._get_tasks_individually(task_indices, include_consensus)
+
+    def _get_tasks_individually(
+        self, task_indices: List[int], include_consensus: bool
+    ) -> List[Dict[str, Any]]:
+        """get_tasks_bulk without Multicall3, with separate calls per task"""
+        tasks = []
+        for task_index in task_indices:
+            task = {
+                "status": self.fast_task_status(task_index),
+                "respondents": self.get_task_respondents(task_index),
+                "task_hash": self.get_task_hash(task_index),
+            }
+            if include_consensus:
+                try:
+                    task["consensus"] = self.get_consensus_result(task_index)
+                except Exception:
+                    task["consensus"] = None
+            tasks.append(task)
+        return tasks
+
+    def has_responded(self, task_index: int, respondent: str) -> bool:
+        """Check whether an address has already responded to a task"""
+        result = self._call_view(
+            HAS_RESPONDED_SELECTOR,
+            task_index.to_bytes(32, "big"),
+            bytes.fromhex(checksum_address(respondent)[2:]).rjust(32, b"\0"),
+        )
+        return bool(int.from_bytes(result, "big"))
 
     def get_consensus_result(self, task_index: int) -> Tuple[bytes, bool]:
         """Get the consensus result for a task"""
-        return self.contract.functions.getConsensusResult(task_index).call()
+        result = self._call_view(
+            CONSENSUS_RESULT_SELECTOR, task_index.to_bytes(32, "big")
+        )
+        return tuple(decode(["bytes", "bool"], result))
 
     def get_task_hash(self, task_index: int) -> bytes:
         """Get the hash of a task"""
-        return self.contract.functions.allTaskHashes(task_index).call()
+        return self._call_view(TASK_HASH_SELECTOR, task_index.to_bytes(32, "big"))
 
     def reconstruct_task(self, task_index: int) -> Optional[Dict[str, Any]]:
         """
-        Reconstructs a task from blockchain data by calling the getTask function.
+        Reconstructs a task from blockchain data via the getter detected at init.
 
         Args:
             task_index: Index of the task to reconstruct
@@ -202,18 +696,22 @@ class Oracle:
             Dictionary with task data ('name', 'taskCreatedBlock')
             or None if not found/error.
         """
-        logger.debug(f"Attempting to reconstruct task {task_index} via getTask().")
+        if self._task_getter is None:
+            logger.warning("Oracle ABI has no task getter, falling back to logs.")
+            return self._reconstruct_from_logs(task_index)
+
+        getter = self._task_getter
+        logger.debug(f"Attempting to reconstruct task {task_index} via {getter}().")
 
         try:
-            # Call the getTask function directly
-            # The function returns a tuple: (name, taskCreatedBlock)
-            task_data = self.contract.functions.getTask(task_index).call()
+            # The getter returns a tuple: (name, taskCreatedBlock)
+            task_data = self._task_getter_fn(task_index).call()
 
             # Check if data was returned
             if task_data and len(task_data) == 2 and task_data[1] > 0:
                 task_name = task_data[0]
                 task_created_block = task_data[1]
-                logger.info(f"Reconstructed task {task_index} via getTask():")
+                logger.info(f"Reconstructed task {task_index} via {getter}():")
                 logger.info(f"  Name: '{task_name}'")
                 logger.info(f"  Block: {task_created_block}")
                 return {
@@ -224,19 +722,178 @@ class Oracle:
                 # This case might happen if the task index is invalid
                 # or getTask returns unexpected data
                 logger.warning(
-                    f"getTask({task_index}) returned unexpected data"
+                    f"{getter}({task_index}) returned unexpected data"
                     " or task doesn't exist."
                 )
                 logger.warning(f"  Data received: {task_data}")
                 return None
 
+        except TRANSPORT_ERRORS:
+            raise
+        except Exception as e:
+            # Catch potential errors like ContractLogicError (if task doesn't exist)
+            # or an ABI mismatch; connection issues propagate above
+            logger.error(f"Error calling {getter}({task_index}) on contract: {e}")
+            # loguru only formats the traceback when debug logging is enabled
+            logger.opt(exception=e).debug(f"{getter}({task_index}) traceback")
+
+        return None
+
+    def reconstruct_tasks(
+        self, task_indices: List[int]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Reconstruct several tasks with one Multicall3 call to the task getter
+
+        Tasks whose getter call fails are returned as None, like in
+        reconstruct_task.
+
+        Args:
+            task_indices: Indices of the tasks to reconstruct
+
+        Returns:
+            Task dictionaries (or None if not found), in the same order
+            as task_indices
+        """
+        if not task_indices:
+            return []
+
+        if self._task_getter is None:
+            return [self._reconstruct_from_logs(i) for i in task_indices]
+
+        if not self._multicall_available():
+            return [self.reconstruct_task(i) for i in task_indices]
+
+        try:
+            results = self.multicall.aggregate(
+                [
+                    (self.address, self._task_getter_selector + i.to_bytes(32, "big"))
+                    for i in task_indices
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Multicall task lookup failed, querying one by one: {e}")
+            return [self.reconstruct_task(i) for i in task_indices]
+
+        tasks = []
+        for task_index, (success, return_data) in zip(task_indices, results):
+            if not success:
+                tasks.append(None)
+                continue
+
+            try:
+                task_data = decode(self._task_getter_output_types, return_data)
+                # getTask returns the struct as a single tuple output
+                if len(task_data) == 1:
+                    task_data = task_data[0]
+
+                task_name, task_created_block = task_data
+            except Exception as e:
+                logger.error(f"Could not decode task {task_index}: {e}")
+                tasks.append(None)
+                continue
+
+            tasks.append(
+                {"name": task_name, "taskCreatedBlock": task_created_block}
+                if task_created_block > 0
+                else None
+            )
+        return tasks
+
+    def _reconstruct_from_logs(self, task_index: int) -> Optional[Dict[str, Any]]:
+        """Fall back to the NewTaskCreated event emitted at task creation"""
+        try:
+            return self.get_task_from_logs(task_index)
+        except TRANSPORT_ERRORS:
+            raise
         except Exception as e:
-            # Catch potential errors like ContractLogicError (if task doesn't exist),
-            # ABI mismatch, connection issues etc.
-            logger.error(f"Error calling getTask({task_index}) on contract.")
-            logger.error(f"  Error details: {e}")
-            logger.error("Is the contract deployed with getTask and ABI updated?")
-            import traceback
-
-            traceback.print_exc()  # Log the full traceback for debugging
+            logger.error(f"Could not find task {task_index} in logs: {e}")
             return None  # Indicate failure
+
+    def get_task_from_logs(self, task_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up a task from its NewTaskCreated event
+
+        Scanning starts at the contract's deployment block, only blocks not
+        covered by earlier lookups are scanned, in chunks of LOG_CHUNK_SIZE,
+        and every task found along the way is cached.
+
+        Args:
+            task_index: Index of the task to look up
+
+        Returns:
+            Dictionary with task data ('name', 'taskCreatedBlock')
+            or None if no event was found.
+        """
+        if task_index in self._task_event_cache:
+            return self._task_event_cache[task_index]
+
+        event = self.contract.events.NewTaskCreated()
+        latest_block = self.web3.eth.block_number
+
+        while self._event_scanned_to <= latest_block:
+            to_block = min(self._event_scanned_to + LOG_CHUNK_SIZE - 1, latest_block)
+            for log in event.get_logs(
+                from_block=self._event_scanned_to, to_block=to_block
+            ):
+                task_name, task_created_block = log["args"]["task"]
+                self._task_event_cache[log["args"]["taskIndex"]] = {
+                    "name": task_name,
+                    "taskCreatedBlock": task_created_block,
+                }
+            self._event_scanned_to = to_block + 1
+
+            if task_index in self._task_event_cache:
+                break
+
+        return self._task_event_cache.get(task_index)
+
+    # Async versions of the read methods. The sync provider is thread-safe
+    # and pooled, so running calls in worker threads lets callers gather
+    # several reads and pay roughly one round trip.
+
+    async def aget_latest_task_num(self, max_age: float = 0) -> int:
+        """Async version of get_latest_task_num"""
+        return await asyncio.to_thread(self.get_latest_task_num, max_age)
+
+    async def aget_task_status(self, task_index: int) -> TaskStatus:
+        """Async version of get_task_status"""
+        return await asyncio.to_thread(self.get_task_status, task_index)
+
+    async def aget_task_statuses(self, task_indices: List[int]) -> List[TaskStatus]:
+        """Async version of get_task_statuses"""
+        return await asyncio.to_thread(self.get_task_statuses, task_indices)
+
+    async def aget_tasks_bulk(
+        self, task_indices: List[int], include_consensus: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Async version of get_tasks_bulk"""
+        return await asyncio.to_thread(
+            self.get_tasks_bulk, task_indices, include_consensus
+        )
+
+    async def aget_task_respondents(self, task_index: int) -> List[str]:
+        """Async version of get_task_respondents"""
+        return await asyncio.to_thread(self.get_task_respondents, task_index)
+
+    async def ahas_responded(self, task_index: int, respondent: str) -> bool:
+        """Async version of has_responded"""
+        return await asyncio.to_thread(self.has_responded, task_index, respondent)
+
+    async def aget_consensus_result(self, task_index: int) -> Tuple[bytes, bool]:
+        """Async version of get_consensus_result"""
+        return await asyncio.to_thread(self.get_consensus_result, task_index)
+
+    async def aget_task_hash(self, task_index: int) -> bytes:
+        """Async version of get_task_hash"""
+        return await asyncio.to_thread(self.get_task_hash, task_index)
+
+    async def areconstruct_task(self, task_index: int) -> Optional[Dict[str, Any]]:
+        """Async version of reconstruct_task"""
+        return await asyncio.to_thread(self.reconstruct_task, task_index)
+
+    async def areconstruct_tasks(
+        self, task_indices: List[int]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Async version of reconstruct_tasks"""
+        return await asyncio.to_thread(self.reconstruct_tasks, task_indices)
@@ -1,4 +1,6 @@
-from typing import List, Optional
+import asyncio
+import time
+from typing import List, Optional, Tuple
 
 from loguru import logger
 from pydantic import BaseModel
@@ -37,6 +39,15 @@ class Registry:
         self.abi = load_abi("AIAgentRegistry.json")
         self.contract = self.web3.eth.contract(address=self.address, abi=self.abi)
 
+        # Contract functions bound once instead of looked up per call
+        self._fn_get_all_agents = self.contract.functions.getAllAgents
+        self._fn_get_agent_count = self.contract.functions.getAgentCount
+        self._fn_is_registered = self.contract.functions.isRegistered
+        self._fn_get_agent_details = self.contract.functions.getAgentDetails
+
+        # Last getAgentCount reading as (monotonic time, value)
+        self._agent_count_cache: Optional[Tuple[float, int]] = None
+
         # Set up account if private key is provided
         self.account = None
         if private_key:
@@ -44,19 +55,34 @@ class Registry:
 
     def get_all_agents(self) -> List[str]:
         """Get all registered agent addresses"""
-        return self.contract.functions.getAllAgents().call()
+        return self._fn_get_all_agents().call()
 
-    def get_agent_count(self) -> int:
-        """Get count of registered agents"""
-        return self.contract.functions.getAgentCount().call()
+    def get_agent_count(self, max_age: float = 0) -> int:
+        """
+        Get count of registered agents
+
+        Args:
+            max_age: Seconds a previous reading may be reused for instead of
+                calling the contract; 0 always queries
+
+        Returns:
+            Number of registered agents
+        """
+        cached = self._agent_count_cache
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        agent_count = self._fn_get_agent_count().call()
+        self._agent_count_cache = (time.monotonic(), agent_count)
+        return agent_count
 
     def is_agent_registered(self, agent_address: str) -> bool:
         """Check if an agent is registered"""
-        return self.contract.functions.isRegistered(agent_address).call()
+        return self._fn_is_registered(agent_address).call()
 
     def get_agent_details(self, agent_address: str) -> AgentDetails:
         """Get detailed information about an agent"""
-        details = self.contract.functions.getAgentDetails(agent_address).call()
+        details = self._fn_get_agent_details(agent_address).call()
 
         return AgentDetails(
             model_type=details[0],
@@ -96,7 +122,23 @@ class Registry:
         logger.info(f"Registering agent: {agent_address}")
 
         # Sign and send
-        signed_tx = self.web3.eth.account.sign_transaction(tx, self.private_key)
+        signed_tx = self.account.sign_transaction(tx)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
 
         return tx_hash.hex()
+
+    async def aget_all_agents(self) -> List[str]:
+        """Async version of get_all_agents"""
+        return await asyncio.to_thread(self.get_all_agents)
+
+    async def aget_agent_count(self, max_age: float = 0) -> int:
+        """Async version of get_agent_count"""
+        return await asyncio.to_thread(self.get_agent_count, max_age)
+
+    async def ais_agent_registered(self, agent_address: str) -> bool:
+        """Async version of is_agent_registered"""
+        return await asyncio.to_thread(self.is_agent_registered, agent_address)
+
+    async def aget_agent_details(self, agent_address: str) -> AgentDetails:
+        """Async version of get_agent_details"""
+        return await asyncio.to_thread(self.get_agent_details, agent_address)
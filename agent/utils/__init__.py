@@ -1,16 +1,30 @@
 """Utility modules for the EigenLayer AI agent."""
 
+from .bitset import TaskIndexSet
 from .config import create_directory_structure, load_config
 from .logger import setup_logging
-from .web3 import get_abi_path, load_abi, load_contract, setup_web3, sign_message
+from .shutdown import install_shutdown_event
+from .web3 import (
+    checksum_address,
+    get_abi_path,
+    health_check,
+    load_abi,
+    load_contract,
+    setup_web3,
+    sign_message,
+)
 
 __all__ = [
+    "TaskIndexSet",
     "create_directory_structure",
     "load_config",
     "setup_logging",
+    "install_shutdown_event",
     "get_abi_path",
+    "health_check",
     "load_abi",
     "load_contract",
     "setup_web3",
     "sign_message",
+    "checksum_address",
 ]
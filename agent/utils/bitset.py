@@ -0,0 +1,62 @@
+"""Compact task-index tracking for the EigenLayer AI agent."""
+
+
+class TaskIndexSet:
+    """
+    Set of non-negative task indices backed by a watermark and a bitset
+
+    Task indices are dense and contiguous and are mostly processed in order,
+    so every index below a watermark is implicitly present and only the
+    indices above it are tracked, one bit each. Fully set leading bytes are
+    folded into the watermark, keeping memory bounded by the number of
+    out-of-order "holes" rather than by the highest index seen.
+    Supports the ``in``/``add`` operations used by the polling loops.
+    """
+
+    __slots__ = ("_base", "_buf", "_count")
+
+    def __init__(self):
+        # Every index below _base is present; bit 0 of _buf is index _base
+        self._base = 0
+        self._buf = bytearray()
+        self._count = 0
+
+    def __contains__(self, index) -> bool:
+        if index < self._base:
+            return index >= 0
+
+        offset = index - self._base
+        byte = offset >> 3
+        if byte >= len(self._buf):
+            return False
+        return bool((self._buf[byte] >> (offset & 7)) & 1)
+
+    def add(self, index: int):
+        """Mark a task index as processed"""
+        if index < 0:
+            raise ValueError(f"Task index must be non-negative, got {index}")
+        if index < self._base:
+            return
+
+        offset = index - self._base
+        byte = offset >> 3
+        if byte >= len(self._buf):
+            # Grow geometrically to amortise resizes
+            self._buf.extend(bytes(max(byte + 1, 2 * len(self._buf)) - len(self._buf)))
+
+        mask = 1 << (offset & 7)
+        if self._buf[byte] & mask:
+            return
+        self._buf[byte] |= mask
+        self._count += 1
+
+        # Fold the fully processed prefix into the watermark
+        if self._buf[0] == 0xFF:
+            full = 1
+            while full < len(self._buf) and self._buf[full] == 0xFF:
+                full += 1
+            del self._buf[:full]
+            self._base += full * 8
+
+    def __len__(self) -> int:
+        return self._count
@@ -5,9 +5,23 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # optional, only speeds up parsing large JSON files
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def read_json(path) -> Any:
+    """Parse a JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from a JSON file or default location.
@@ -33,8 +47,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         return {}
 
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
+        config = read_json(config_path)
         logger.debug(f"Configuration loaded successfully from {config_path}")
         return config
     except Exception as e:
@@ -44,19 +57,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
 def create_directory_structure():
     """Create necessary directories for the agent"""
-    # Create data directory
     data_dir = Path.cwd() / "data"
-    if not data_dir.exists():
-        data_dir.mkdir()
-        logger.info(f"Created data directory: {data_dir}")
-
-    # Create subdirectories
-    tasks_dir = data_dir / "tasks"
-    if not tasks_dir.exists():
-        tasks_dir.mkdir()
-        logger.info(f"Created tasks directory: {tasks_dir}")
-
-    responses_dir = data_dir / "responses"
-    if not responses_dir.exists():
-        responses_dir.mkdir()
-        logger.info(f"Created responses directory: {responses_dir}")
+    for directory in (data_dir, data_dir / "tasks", data_dir / "responses"):
+        # One mkdir syscall per directory; existing ones are left alone
+        directory.mkdir(parents=True, exist_ok=True)
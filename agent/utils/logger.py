@@ -14,9 +14,8 @@ def setup_logging(log_level="INFO"):
     Args:
         log_level: The logging level (default: "INFO")
     """
-    # Create logs directory if it doesn't exist
+    # loguru creates the directory itself when the file is first opened
     logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
 
     # Create a timestamped log file name
     timestamp = time.strftime("%Y%m%d-%H%M%S")
@@ -38,12 +37,16 @@ def setup_logging(log_level="INFO"):
             <cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     )
 
-    # Add file handler with rotation
+    # Add file handler with rotation; records are handed to a background
+    # writer thread so task processing never waits on disk I/O or rotation,
+    # and the file is only created once the first record reaches it
     logger.add(
         log_file,
         rotation="10 MB",
         retention="1 week",
         level=log_level,
+        enqueue=True,
+        delay=True,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} \
             | {name}:{function}:{line} - {message}",
     )
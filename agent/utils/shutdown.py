@@ -0,0 +1,25 @@
+"""Graceful shutdown helpers for the agent's polling loops."""
+
+import asyncio
+import signal
+
+
+def install_shutdown_event() -> asyncio.Event:
+    """
+    Create an event that SIGINT/SIGTERM set on the running loop
+
+    Must be called from a coroutine, so the event belongs to the loop that
+    waits on it.
+
+    Returns:
+        asyncio.Event: Set once a shutdown signal arrives
+    """
+    event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, event.set)
+        except (NotImplementedError, RuntimeError):
+            # Unsupported on Windows and outside the main thread
+            pass
+    return event
@@ -1,58 +1,170 @@
 """Web3 utilities for the EigenLayer AI agent."""
 
-import json
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
+import requests
 from eth_account.messages import encode_defunct
-from web3 import Web3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import HTTPProvider, LegacyWebSocketProvider, Web3
+
+from .config import read_json
 
 logger = logging.getLogger(__name__)
 
+# Directories searched for ABI files, in order, relative to the current
+# working directory or its parent ('contracts/out' holds Forge artifacts)
+ABI_SEARCH_DIRS = (
+    ("cwd", "abis"),
+    ("parent", "abis"),
+    ("parent", "contracts/out"),
+    ("cwd", "abi"),
+    ("cwd", "artifacts"),
+    ("parent", "abi"),
+    ("parent", "artifacts"),
+)
+
+# Contracts built by load_contract: Web3 instance -> {(address, abi): contract}
+_CONTRACT_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+# Provider URI schemes served over a websocket instead of HTTP
+WEBSOCKET_SCHEMES = frozenset({"ws", "wss"})
+
+# Keep-alive connection pool shared by all RPC calls on one provider;
+# sized above the number of threads issuing concurrent calls
+RPC_POOL_CONNECTIONS = 32
+RPC_POOL_MAXSIZE = 64
+
+# Retries for RPC connections that could not be established; nothing has
+# been sent at that point, so even eth_sendRawTransaction is safe to retry
+RPC_CONNECT_RETRIES = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+
+# Checksumming keccak-hashes the address; the same few contract and agent
+# addresses are converted over and over, so memoize the result
+checksum_address = lru_cache(maxsize=256)(Web3.to_checksum_address)
+
+
+# Minimal AIOracleServiceManager ABI used when the ABI file cannot be found
+AIORACLE_MINIMAL_ABI = [
+    {
+        "inputs": [],
+        "name": "latestTaskNum",
+        "outputs": [{"internalType": "uint32", "name": "", "type": "uint32"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "name", "type": "string"}],
+        "name": "createNewTask",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "internalType": "string",
+                        "name": "name",
+                        "type": "string",
+                    },
+                    {
+                        "internalType": "uint32",
+                        "name": "taskCreatedBlock",
+                        "type": "uint32",
+                    },
+                ],
+                "internalType": "struct IAIOracleServiceManager.Task",
+                "name": "",
+                "type": "tuple",
+            }
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# Multicall3 aggregate3 ABI used when Multicall3.json cannot be found
+MULTICALL3_MINIMAL_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+
+@lru_cache(maxsize=4)
+def _abi_index(cwd: Path) -> Dict[str, Path]:
+    """
+    Map file names to paths across ABI_SEARCH_DIRS for a working directory
+
+    Each directory is listed once with os.scandir; earlier directories win.
+    """
+    index: Dict[str, Path] = {}
+    for base, directory in ABI_SEARCH_DIRS:
+        search_dir = (cwd.parent if base == "parent" else cwd) / directory
+        try:
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    index.setdefault(entry.name, Path(entry.path))
+        except OSError:
+            continue
+    return index
+
 
 def get_abi_path(filename: str) -> Path:
     """Get the path to an ABI file, searching in multiple locations"""
-    # First check in the 'abis' directory in the current folder
-    abi_path = Path.cwd() / "abis" / filename
-    if abi_path.exists():
+    cwd = Path.cwd()
+    abi_path = _abi_index(cwd).get(filename)
+    if abi_path is None:
+        # The file may have been added since the directories were listed
+        _abi_index.cache_clear()
+        abi_path = _abi_index(cwd).get(filename)
+    if abi_path is not None:
         return abi_path
 
-    # Try the parent folder
-    parent_abi_path = Path.cwd().parent / "abis" / filename
-    if parent_abi_path.exists():
-        return parent_abi_path
-
-    # Try in a specific 'contracts/out' directory for Forge artifacts
-    forge_artifacts = Path.cwd().parent / "contracts" / "out" / filename
-    if forge_artifacts.exists():
-        return forge_artifacts
-
-    # If not found, check in common locations
-    common_locations = [
-        Path.cwd() / "abi",
-        Path.cwd() / "artifacts",
-        Path.cwd().parent / "abi",
-        Path.cwd().parent / "artifacts",
-    ]
-
-    for location in common_locations:
-        potential_abi = location / filename
-        if potential_abi.exists():
-            return potential_abi
-
     # If we still haven't found it, raise an error
     raise FileNotFoundError(f"Could not find ABI file: {filename}")
 
 
+@lru_cache(maxsize=None)
 def load_abi(filename: str) -> Any:
-    """Load ABI from a JSON file"""
+    """
+    Load ABI from a JSON file
+
+    Results are cached per filename, so every contract wrapper shares one
+    parsed ABI object; callers must treat it as read-only.
+    """
     try:
         abi_path = get_abi_path(filename)
 
-        with open(abi_path, "r") as f:
-            abi_json = json.load(f)
+        abi_json = read_json(abi_path)
 
         # Handle different ABI file formats
         if isinstance(abi_json, dict):
@@ -78,8 +190,7 @@ def load_abi(filename: str) -> Any:
         direct_path = Path("abis") / filename
         if direct_path.exists():
             logger.info(f"Found ABI file directly in {direct_path}")
-            with open(direct_path, "r") as f:
-                abi_json = json.load(f)
+            abi_json = read_json(direct_path)
 
             # Also check for 'abi' field in direct path
             if isinstance(abi_json, dict) and "abi" in abi_json:
@@ -90,45 +201,10 @@ def load_abi(filename: str) -> Any:
         # Special case for AIOracleServiceManager - load the ABI directly
         if filename == "AIOracleServiceManager.json":
             logger.info("Using hardcoded minimal ABI for AIOracleServiceManager")
-            minimal_abi = [
-                {
-                    "inputs": [],
-                    "name": "latestTaskNum",
-                    "outputs": [
-                        {"internalType": "uint32", "name": "", "type": "uint32"}
-                    ],
-                    "stateMutability": "view",
-                    "type": "function",
-                },
-                {
-                    "inputs": [
-                        {"internalType": "string", "name": "name", "type": "string"}
-                    ],
-                    "name": "createNewTask",
-                    "outputs": [
-                        {
-                            "components": [
-                                {
-                                    "internalType": "string",
-                                    "name": "name",
-                                    "type": "string",
-                                },
-                                {
-                                    "internalType": "uint32",
-                                    "name": "taskCreatedBlock",
-                                    "type": "uint32",
-                                },
-                            ],
-                            "internalType": "struct IAIOracleServiceManager.Task",
-                            "name": "",
-                            "type": "tuple",
-                        }
-                    ],
-                    "stateMutability": "nonpayable",
-                    "type": "function",
-                },
-            ]
-            return minimal_abi
+            return AIORACLE_MINIMAL_ABI
+        if filename == "Multicall3.json":
+            logger.info("Using hardcoded aggregate3 ABI for Multicall3")
+            return MULTICALL3_MINIMAL_ABI
 
         # Otherwise raise the original error
         raise
@@ -141,33 +217,96 @@ def sign_message(web3: Web3, message: str, private_key: str) -> bytes:
     return signed_message.signature
 
 
-def setup_web3(provider_uri: str) -> Web3:
-    """Set up Web3 connection with proxy support"""
-    # Add proxy support
-    request_kwargs = {"timeout": 30}
+def _rpc_session() -> requests.Session:
+    """Create the pooled requests session used by the HTTP provider"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=RPC_POOL_CONNECTIONS,
+        pool_maxsize=RPC_POOL_MAXSIZE,
+        max_retries=RPC_CONNECT_RETRIES,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _env_proxies() -> Dict[str, str]:
+    """
+    Read HTTP(S) proxy settings from the environment
+
+    Read once, on the first setup_web3 call rather than at import time,
+    so settings loaded from a .env file by the CLI are still picked up.
+    """
+    proxies = {}
+    https_proxy = os.getenv("HTTPS_PROXY") or os.getenv("https_proxy")
+    if https_proxy:
+        proxies["https"] = https_proxy
+    http_proxy = os.getenv("HTTP_PROXY") or os.getenv("http_proxy")
+    if http_proxy:
+        proxies["http"] = http_proxy
+    return proxies
+
 
-    if provider_uri == "http://localhost:8545":
-        web3 = Web3(Web3.HTTPProvider(provider_uri, request_kwargs=request_kwargs))
+def setup_web3(provider_uri: str, verify: bool = False) -> Web3:
+    """
+    Set up Web3 connection with proxy support
+
+    Args:
+        provider_uri: HTTP(S) or websocket RPC endpoint
+        verify: Run health_check on the new instance; this costs two RPCs,
+            so long-lived callers should check once at startup instead
+
+    Returns:
+        Web3: Configured Web3 instance
+    """
+    if urlparse(provider_uri).scheme in WEBSOCKET_SCHEMES:
+        # Websocket RPC keeps one persistent connection; proxies and the
+        # pooled HTTP session do not apply
+        web3 = Web3(LegacyWebSocketProvider(provider_uri))
     else:
-        # Handle proxy settings
-        http_proxy = os.getenv("HTTP_PROXY") or os.getenv("http_proxy")
-        https_proxy = os.getenv("HTTPS_PROXY") or os.getenv("https_proxy")
+        web3 = Web3(_http_provider(provider_uri))
+
+    if verify:
+        health_check(web3)
+    return web3
+
 
-        if http_proxy or https_proxy:
-            proxies = {}
-            if https_proxy:
-                proxies["https"] = https_proxy
-            if http_proxy:
-                proxies["http"] = http_proxy
+def _http_provider(provider_uri: str) -> HTTPProvider:
+    """Build the pooled, proxy-aware HTTP provider for an RPC endpoint"""
+    # Add proxy support
+    request_kwargs = {"timeout": 30}
 
-            if proxies:
-                logger.info(f"Using proxy settings: {proxies}")
-                request_kwargs["proxies"] = proxies
+    # Handle proxy settings (not needed for a local node)
+    if provider_uri != "http://localhost:8545":
+        proxies = _env_proxies()
+        if proxies:
+            logger.info(f"Using proxy settings: {proxies}")
+            request_kwargs["proxies"] = proxies
+
+    # Create the provider with proxy configuration and a pooled session.
+    # Oracle, Registry, Multicall and AgentInterface all share this instance,
+    # so every RPC reuses the same keep-alive connections. Request caching
+    # answers repeat eth_chainId lookups (one per build_transaction) locally.
+    return HTTPProvider(
+        provider_uri,
+        request_kwargs=request_kwargs,
+        session=_rpc_session(),
+        cache_allowed_requests=True,
+    )
+
+
+def health_check(web3: Web3) -> bool:
+    """
+    Log whether the provider is reachable and which chain it serves
 
-        # Create Web3 instance with proxy configuration
-        web3 = Web3(Web3.HTTPProvider(provider_uri, request_kwargs=request_kwargs))
+    On HTTP providers eth_chainId is answered from the request cache after
+    the first call, so repeat checks cost a single round trip.
 
-    # Verify connection
+    Returns:
+        bool: True if the provider answered
+    """
+    provider_uri = getattr(web3.provider, "endpoint_uri", web3.provider)
     try:
         connected = web3.is_connected()
         if connected:
@@ -175,24 +314,34 @@ def setup_web3(provider_uri: str) -> Web3:
             logger.info(f"Chain ID: {web3.eth.chain_id}")
         else:
             logger.warning(f"Could not connect to {provider_uri}")
+        return connected
     except Exception as e:
         logger.error(f"Error connecting to provider: {e}")
-
-    return web3
+        return False
 
 
-def load_contract(web3, address, abi_path_or_filename):
+def load_contract(web3, address, abi_path_or_filename, force_reload=False):
     """
     Load a contract with detailed logging
 
+    Contracts are cached per Web3 instance, address and ABI source, so
+    repeat loads skip ABI handling and the eth_getCode check.
+
     Args:
         web3: Web3 instance
         address: Contract address
         abi_path_or_filename: Path to ABI file or just the filename
+        force_reload: Rebuild the contract even if it is cached
 
     Returns:
         Contract: Web3 contract instance
     """
+    address = checksum_address(address)
+    cache_key = (address, str(abi_path_or_filename))
+    contracts = _CONTRACT_CACHE.setdefault(web3, {})
+    if not force_reload and cache_key in contracts:
+        return contracts[cache_key]
+
     logger.info(f"Loading contract at address: {address}")
     try:
         # Check if abi_path_or_filename is a Path object or string path to a file
@@ -202,8 +351,7 @@ def load_contract(web3, address, abi_path_or_filename):
             or "\\" in abi_path_or_filename
         ):
             # It's a path, load directly
-            with open(abi_path_or_filename, "r") as f:
-                abi_json = json.load(f)
+            abi_json = read_json(abi_path_or_filename)
 
             # Process the loaded ABI data
             if isinstance(abi_json, dict) and "abi" in abi_json:
@@ -217,12 +365,12 @@ def load_contract(web3, address, abi_path_or_filename):
             abi = load_abi(abi_path_or_filename)
 
         # Create contract instance
-        contract = web3.eth.contract(address=web3.to_checksum_address(address), abi=abi)
+        contract = web3.eth.contract(address=address, abi=abi)
 
         # Verify contract exists on-chain
         try:
             code = web3.eth.get_code(address)
-            if code.hex() == "0x":
+            if not code:
                 logger.warning(f"No code at {address}! Contract might not be deployed.")
             else:
                 logger.debug(f"Contract code verified at {address}")
@@ -230,6 +378,7 @@ def load_contract(web3, address, abi_path_or_filename):
             logger.warning(f"Could not verify contract code: {e}")
 
         logger.info(f"Contract loaded successfully at {address}")
+        contracts[cache_key] = contract
         return contract
 
     except Exception as e:
@@ -9,12 +9,12 @@ This version assumes:
 import logging
 import os
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from agent.__main__ import PredictionMarketBridge
-from agent.interface import AgentInterface
 from tests.integration.test_utils import (
     create_oracle_task,
     get_oracle_instance,
@@ -46,25 +46,64 @@ REGISTRY_ADDRESS = CONFIG.get("registry_address")
 AGENT_ADDRESS = CONFIG.get("agent_address")
 
 # Log the configuration being used
-logger.info("--- Test Market Configuration ---")
-logger.info(f"RPC URL: {RPC_URL}")
-logger.info(f"Oracle Address: {ORACLE_ADDRESS}")
-logger.info(f"Registry Address: {REGISTRY_ADDRESS}")
-logger.info(f"Agent Address: {AGENT_ADDRESS}")
-logger.info("-------------------------------")
+logger.info(
+    "--- Test Market Configuration ---\n"
+    "RPC URL: %s\n"
+    "Oracle Address: %s\n"
+    "Registry Address: %s\n"
+    "Agent Address: %s\n"
+    "-------------------------------",
+    RPC_URL,
+    ORACLE_ADDRESS,
+    REGISTRY_ADDRESS,
+    AGENT_ADDRESS,
+)
+
+# Config file handed to the bridge, resolved once: CWD first, then project root
+BRIDGE_CONFIG_PATH = next(
+    (
+        path
+        for path in (
+            Path.cwd() / "config.json",
+            Path(__file__).parent.parent / "config.json",
+        )
+        if path.is_file()
+    ),
+    None,
+)
+
+# Receipt polling for cleanup transactions; the configured RPC may be a
+# public testnet with ~1s blocks, where 0.1s polling mostly burns requests
+RECEIPT_TIMEOUT = 120
+RECEIPT_POLL_LATENCY = 0.5
 
 # Check required configuration from loaded config
-if not ORACLE_ADDRESS:
-    logger.error("'oracle_address' not found in configuration.")
-    sys.exit(1)
-if not REGISTRY_ADDRESS:
-    logger.error("'registry_address' not found in configuration.")
+missing_keys = [
+    key for key in ("oracle_address", "registry_address") if not CONFIG.get(key)
+]
+if missing_keys:
+    logger.error(f"Missing configuration keys: {', '.join(missing_keys)}")
     sys.exit(1)
 
 
+@lru_cache(maxsize=1)
+def shared_web3():
+    """Web3 instance shared by every test in this module"""
+    return get_web3_instance(RPC_URL)
+
+
+@lru_cache(maxsize=1)
+def shared_oracle():
+    """Oracle client shared by every test in this module"""
+    web3 = shared_web3()
+    if not web3:
+        return None
+    return get_oracle_instance(web3, ORACLE_ADDRESS)
+
+
 def check_blockchain_connection():
     """Verify connection to the blockchain using the config RPC URL"""
-    web3 = get_web3_instance(RPC_URL)
+    web3 = shared_web3()
     if not web3:
         logger.error(f"Could not connect to blockchain at {RPC_URL}")
         return False
@@ -74,20 +113,21 @@ def check_blockchain_connection():
     block_number = web3.eth.block_number
     accounts = web3.eth.accounts
 
-    logger.info("Successfully connected to blockchain:")
-    logger.info(f"  Chain ID: {chain_id}")
-    logger.info(f"  Current block: {block_number}")
-    logger.info(f"  Available accounts: {len(accounts)}")
+    logger.info(
+        "Successfully connected to blockchain:\n"
+        "  Chain ID: %s\n"
+        "  Current block: %s\n"
+        "  Available accounts: %s",
+        chain_id,
+        block_number,
+        len(accounts),
+    )
     return True
 
 
 def create_test_task():
     """Create test task in oracle using the loaded config addresses"""
-    web3 = get_web3_instance(RPC_URL)
-    if not web3:
-        return None
-
-    oracle = get_oracle_instance(web3, ORACLE_ADDRESS)
+    oracle = shared_oracle()
     if not oracle:
         return None
 
@@ -124,7 +164,7 @@ def cleanup_task(task_index):
         logger.error("Cannot clean up None task index")
         return False
 
-    web3 = get_web3_instance(RPC_URL)
+    web3 = shared_web3()
     if not web3:
         logger.error("Could not connect to web3 to clean up task")
         return False
@@ -139,6 +179,9 @@ def cleanup_task(task_index):
         logger.error("No agent_address in config, cannot clean up task")
         return False
 
+    # Imported here so collecting this module does not load the agent stack
+    from agent.interface import AgentInterface
+
     try:
         # Create agent interface
         agent = AgentInterface(web3, AGENT_ADDRESS, private_key)
@@ -148,7 +191,9 @@ def cleanup_task(task_index):
         tx_hash = agent.process_task(task_index, True)  # True = YES
 
         # Wait for receipt
-        receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+        )
         if receipt.status == 1:
             logger.info(f"Successfully cleaned up task {task_index}")
             return True
@@ -157,27 +202,25 @@ def cleanup_task(task_index):
             return False
     except Exception as e:
         logger.error(f"Error cleaning up task {task_index}: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
 
 def run_bridge(run_once=True):
     """Run the prediction market bridge using the loaded config/addresses"""
+    # The bridge pulls in the LLM backend, manager and CLI; load them on use
+    from agent.__main__ import PredictionMarketBridge
+
     try:
         # Bridge uses the config file for non-sensitive parts,
         # and we pass addresses explicitly if needed (though it might load them again)
         # Sensitive keys are loaded from env by Bridge.__init__
-        current_config_path = Path.cwd() / "config.json"
-        if not current_config_path.exists():
-            current_config_path = Path(__file__).parent.parent / "config.json"
-            if not current_config_path.exists():
-                logger.error("config.json not found in CWD or project root.")
-                return False  # Cannot run bridge without config
+        if BRIDGE_CONFIG_PATH is None:
+            logger.error("config.json not found in CWD or project root.")
+            return False  # Cannot run bridge without config
 
         bridge = PredictionMarketBridge(
-            config_path=str(current_config_path),
+            config_path=str(BRIDGE_CONFIG_PATH),
             oracle_address=ORACLE_ADDRESS,
         )
 
@@ -188,8 +231,6 @@ def run_bridge(run_once=True):
         return True
     except Exception as e:
         logger.error(f"Error running bridge: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
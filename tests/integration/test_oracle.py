@@ -7,6 +7,7 @@ deployed on a local Anvil instance.
 
 import os
 import sys
+import traceback
 
 import pytest
 import web3
@@ -15,6 +16,8 @@ from dotenv import load_dotenv
 # Import utility functions
 from .test_utils import (
     create_minimal_oracle_abi,
+    get_account,
+    get_contract_code,
     get_default_private_key,
     get_web3_instance,
     load_config,
@@ -23,6 +26,14 @@ from .test_utils import (
 # Load environment variables from .env file
 load_dotenv()
 
+# Anvil mines on submission, so poll for receipts far more often than
+# web3's 0.1s default
+RECEIPT_TIMEOUT = 30
+RECEIPT_POLL_LATENCY = 0.01
+
+# PUSH1 0x80 PUSH1 0x40, the free memory pointer setup solc emits first
+SOLIDITY_PREAMBLE = b"\x60\x80\x60\x40"
+
 print(f"Using Web3.py version: {web3.__version__}")
 
 
@@ -51,7 +62,7 @@ class TestOracleContractTester:
         else:
             print("Using AGENT_PRIVATE_KEY from environment.")
 
-        self.account = self.web3.eth.account.from_key(self.private_key)
+        self.account = get_account(self.private_key)
         print(f"Using account: {self.account.address}")
 
         # Load oracle contract address
@@ -65,7 +76,7 @@ class TestOracleContractTester:
             print(f"Oracle contract address: {self.oracle_address}")
 
             # Check if the contract has code at the address
-            code_size = len(self.web3.eth.get_code(self.oracle_address))
+            code_size = len(get_contract_code(self.web3, self.oracle_address))
             if code_size == 0:
                 print("Warning: No contract code found at the oracle address.")
             else:
@@ -73,15 +84,18 @@ class TestOracleContractTester:
         except Exception as e:
             print(f"Warning: Error checking oracle contract: {e}")
 
+        # Create contract instance with minimal ABI, shared by the tests
+        if hasattr(self, "oracle_address"):
+            self.oracle_contract = self.web3.eth.contract(
+                address=self.oracle_address, abi=create_minimal_oracle_abi()
+            )
+
     def test_oracle_contract(self):
         """Test basic oracle contract functionality"""
         if not hasattr(self, "web3") or not hasattr(self, "oracle_address"):
             pytest.skip("Web3 or oracle address not initialized")
 
-        # Create contract instance with minimal ABI
-        oracle_contract = self.web3.eth.contract(
-            address=self.oracle_address, abi=create_minimal_oracle_abi()
-        )
+        oracle_contract = self.oracle_contract
 
         print("\n=== Testing Oracle Contract ===")
         success = False
@@ -127,8 +141,6 @@ class TestOracleContractTester:
 
         except Exception as e:
             print(f"Error testing oracle contract: {e}")
-            import traceback
-
             traceback.print_exc()
             pytest.skip(f"Oracle contract test failed: {e}")
 
@@ -137,10 +149,7 @@ class TestOracleContractTester:
         if not hasattr(self, "web3") or not hasattr(self, "oracle_address"):
             pytest.skip("Web3 or oracle address not initialized")
 
-        # Create contract instance with minimal ABI
-        oracle_contract = self.web3.eth.contract(
-            address=self.oracle_address, abi=create_minimal_oracle_abi()
-        )
+        oracle_contract = self.oracle_contract
 
         print("\n=== Creating a New Task ===")
 
@@ -169,7 +178,9 @@ class TestOracleContractTester:
             print(f"Transaction sent: {tx_hash.hex()}")
 
             # Wait for transaction receipt
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = self.web3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+            )
             print(f"Transaction confirmed in block {receipt.blockNumber}")
             print(f"Gas used: {receipt.gasUsed}")
 
@@ -182,8 +193,6 @@ class TestOracleContractTester:
 
         except Exception as e:
             print(f"Error creating task: {e}")
-            import traceback
-
             traceback.print_exc()
             # Skip instead of failing - this is expected if contract doesn't match ABI
             pytest.skip(f"Could not create task: {e}")
@@ -196,13 +205,13 @@ class TestOracleContractTester:
         print("\n=== Inspecting Contract Bytecode ===")
 
         try:
-            # Get contract bytecode
-            bytecode = self.web3.eth.get_code(self.oracle_address).hex()
+            # Get contract bytecode, kept as raw bytes
+            bytecode = get_contract_code(self.web3, self.oracle_address)
 
             # We can't easily reverse engineer the ABI from bytecode
             # But we can check if it's a minimal contract or contains real code
 
-            if len(bytecode) <= 100:
+            if len(bytecode) <= 50:
                 print(
                     "This appears to be a minimal contract without much functionality."
                 )
@@ -211,10 +220,10 @@ class TestOracleContractTester:
                     "the Oracle functionality implemented."
                 )
 
-                if bytecode.startswith("0x60806040"):
+                if bytecode[:4] == SOLIDITY_PREAMBLE:
                     print("This appears to be a standard Solidity contract.")
 
-                print(f"Bytecode: {bytecode}")
+                print(f"Bytecode: 0x{bytecode.hex()}")
             else:
                 print(f"Contract has substantial bytecode ({len(bytecode)} bytes)")
                 print(
@@ -252,8 +261,6 @@ def main():
 
     except Exception as e:
         print(f"Error during testing: {e}")
-        import traceback
-
         traceback.print_exc()
         return 1
 
@@ -1,35 +1,98 @@
 #!/usr/bin/env python3
 """
 Common utility functions for integration tests.
+
+web3 and the agent package are imported inside the helpers that need
+them, so importing this module for its constants stays cheap.
 """
 
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
-from agent.oracle import Oracle
-from agent.utils import setup_web3
-
-
+# Minimal ABI covering common oracle functionality
+# In a production environment, you'd use the full ABI
+MINIMAL_ORACLE_ABI = [
+    {
+        "type": "function",
+        "name": "createTask",
+        "inputs": [
+            {"name": "taskType", "type": "uint8"},
+            {"name": "data", "type": "string"},
+        ],
+        "outputs": [{"type": "uint256"}],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "getTaskStatus",
+        "inputs": [{"name": "taskId", "type": "uint256"}],
+        "outputs": [{"type": "uint8"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "resolveTask",
+        "inputs": [
+            {"name": "taskId", "type": "uint256"},
+            {"name": "result", "type": "string"},
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "getTaskCount",
+        "inputs": [],
+        "outputs": [{"type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "getTaskDetails",
+        "inputs": [{"name": "taskId", "type": "uint256"}],
+        "outputs": [
+            {
+                "type": "tuple",
+                "components": [
+                    {"name": "creator", "type": "address"},
+                    {"name": "taskType", "type": "uint8"},
+                    {"name": "status", "type": "uint8"},
+                    {"name": "data", "type": "string"},
+                    {"name": "result", "type": "string"},
+                    {"name": "createdAt", "type": "uint256"},
+                ],
+            }
+        ],
+        "stateMutability": "view",
+    },
+]
+
+# Connected Web3 instances by provider URI; failed connections are not cached
+_WEB3_CACHE = {}
+
+
+@lru_cache(maxsize=4)
 def load_config(config_path=None):
     """
     Load configuration from the specified path or search in common locations.
     Returns the loaded config as a dictionary.
+
+    Results are cached per path for the test session; treat them as read-only.
     """
-    if config_path and Path(config_path).exists():
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            print(f"Using configuration from {config_path}")
-            return config
+    from agent.utils.config import read_json
 
-    config_paths = [Path("config.json"), Path.cwd() / "config.json"]
+    if config_path and Path(config_path).is_file():
+        config = read_json(config_path)
+        print(f"Using configuration from {config_path}")
+        return config
 
-    for path in config_paths:
-        if path.exists():
-            with open(path, "r") as f:
-                config = json.load(f)
-                print(f"Using configuration from {path}")
-                return config
+    # A relative "config.json" is the same file, so one check covers both
+    path = Path.cwd() / "config.json"
+    if path.is_file():
+        config = read_json(path)
+        print(f"Using configuration from {path}")
+        return config
 
     # Default config if none found
     print("No configuration file found, using default local setup")
@@ -47,22 +110,44 @@ def get_default_private_key():
     return "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
 
 
+@lru_cache(maxsize=4)
+def get_account(private_key):
+    """Derive the local account for a private key once per session."""
+    from eth_account import Account
+
+    return Account.from_key(private_key)
+
+
+@lru_cache(maxsize=8)
+def get_contract_code(web3, address):
+    """Fetch the deployed bytecode at an address once per session."""
+    return web3.eth.get_code(address)
+
+
 def get_web3_instance(provider_uri=None, config=None):
     """
     Get a Web3 instance connected to the specified provider URI.
     If provider_uri is not specified, it's extracted from config.
     If config is not specified, it's loaded using load_config().
+    Connected instances are reused per provider URI for the whole session.
     """
+    from agent.utils import setup_web3
+
     if not provider_uri:
         if not config:
             config = load_config()
         provider_uri = config.get("rpc_url", "http://localhost:8545")
 
+    web3 = _WEB3_CACHE.get(provider_uri)
+    if web3 is not None:
+        return web3
+
     web3 = setup_web3(provider_uri)
     if not web3.is_connected():
         print(f"Could not connect to {provider_uri}")
         return None
 
+    _WEB3_CACHE[provider_uri] = web3
     return web3
 
 
@@ -74,6 +159,8 @@ def get_oracle_instance(web3, oracle_address=None, private_key=None, config=None
     the default Anvil key if not set.
     If config is not specified, it's loaded using load_config().
     """
+    from agent.oracle import Oracle
+
     if not config:
         config = load_config()
 
@@ -111,8 +198,9 @@ def create_oracle_task(
         print(f"Created task with hash: {tx_hash}")
         print(f"Task index: {task_index}")
 
-        # Wait for transaction to be mined
-        receipt = oracle.web3.eth.wait_for_transaction_receipt(tx_hash)
+        # Oracle.create_task only returns once the transaction is mined,
+        # so the receipt can be read directly without polling
+        receipt = oracle.web3.eth.get_transaction_receipt(tx_hash)
         print(
             f"Transaction status: {'Success' if receipt['status'] == 1 else 'Failed'}"
         )
@@ -128,61 +216,5 @@ def create_oracle_task(
 
 
 def create_minimal_oracle_abi():
-    """Create a minimal ABI for basic oracle interactions."""
-    # This is a minimal ABI covering common oracle functionality
-    # In a production environment, you'd use the full ABI
-    return [
-        {
-            "type": "function",
-            "name": "createTask",
-            "inputs": [
-                {"name": "taskType", "type": "uint8"},
-                {"name": "data", "type": "string"},
-            ],
-            "outputs": [{"type": "uint256"}],
-            "stateMutability": "nonpayable",
-        },
-        {
-            "type": "function",
-            "name": "getTaskStatus",
-            "inputs": [{"name": "taskId", "type": "uint256"}],
-            "outputs": [{"type": "uint8"}],
-            "stateMutability": "view",
-        },
-        {
-            "type": "function",
-            "name": "resolveTask",
-            "inputs": [
-                {"name": "taskId", "type": "uint256"},
-                {"name": "result", "type": "string"},
-            ],
-            "outputs": [],
-            "stateMutability": "nonpayable",
-        },
-        {
-            "type": "function",
-            "name": "getTaskCount",
-            "inputs": [],
-            "outputs": [{"type": "uint256"}],
-            "stateMutability": "view",
-        },
-        {
-            "type": "function",
-            "name": "getTaskDetails",
-            "inputs": [{"name": "taskId", "type": "uint256"}],
-            "outputs": [
-                {
-                    "type": "tuple",
-                    "components": [
-                        {"name": "creator", "type": "address"},
-                        {"name": "taskType", "type": "uint8"},
-                        {"name": "status", "type": "uint8"},
-                        {"name": "data", "type": "string"},
-                        {"name": "result", "type": "string"},
-                        {"name": "createdAt", "type": "uint256"},
-                    ],
-                }
-            ],
-            "stateMutability": "view",
-        },
-    ]
+    """Return the shared minimal ABI for basic oracle interactions."""
+    return MINIMAL_ORACLE_ABI
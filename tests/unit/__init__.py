@@ -0,0 +1,3 @@
+"""
+Offline unit tests for the EigenLayer AI Agent
+"""
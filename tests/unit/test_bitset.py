@@ -0,0 +1,60 @@
+"""Unit tests for the watermark-plus-bitset TaskIndexSet."""
+
+import pytest
+
+from agent.utils.bitset import TaskIndexSet
+
+
+class TestTaskIndexSet:
+    def test_empty(self):
+        indices = TaskIndexSet()
+        assert len(indices) == 0
+        assert 0 not in indices
+        assert -1 not in indices
+
+    def test_add_in_order_folds_into_watermark(self):
+        indices = TaskIndexSet()
+        for i in range(20):
+            indices.add(i)
+        assert len(indices) == 20
+        assert all(i in indices for i in range(20))
+        assert 20 not in indices
+        # Two full bytes are folded, leaving only the tail bits tracked
+        assert indices._base == 16
+        assert len(indices._buf) <= 1
+
+    def test_add_out_of_order(self):
+        indices = TaskIndexSet()
+        for i in (9, 3, 0, 17):
+            indices.add(i)
+        assert len(indices) == 4
+        assert [i for i in range(20) if i in indices] == [0, 3, 9, 17]
+        assert indices._base == 0
+
+    def test_filling_holes_moves_watermark(self):
+        indices = TaskIndexSet()
+        for i in range(1, 16):
+            indices.add(i)
+        assert indices._base == 0
+        indices.add(0)
+        assert indices._base == 16
+        assert all(i in indices for i in range(16))
+        assert len(indices) == 16
+
+    def test_duplicate_add_is_counted_once(self):
+        indices = TaskIndexSet()
+        indices.add(5)
+        indices.add(5)
+        for i in range(8):
+            indices.add(i)
+        # Adding below the watermark is a no-op
+        indices.add(3)
+        assert len(indices) == 8
+
+    def test_negative_index(self):
+        indices = TaskIndexSet()
+        with pytest.raises(ValueError):
+            indices.add(-1)
+        for i in range(8):
+            indices.add(i)
+        assert -1 not in indices
@@ -0,0 +1,33 @@
+"""Unit tests for parsing streamed OpenRouter completions."""
+
+import json
+
+import pytest
+
+from agent.llm import OpenRouterBackend
+
+
+def sse(payload) -> str:
+    return "data: " + json.dumps(payload)
+
+
+class TestParseStreamLine:
+    def test_content_delta(self):
+        line = sse({"choices": [{"delta": {"content": "YES"}}]})
+        assert OpenRouterBackend._parse_stream_line(line) == "YES"
+
+    def test_delta_without_content(self):
+        line = sse({"choices": [{"delta": {"role": "assistant"}}]})
+        assert OpenRouterBackend._parse_stream_line(line) == ""
+
+    def test_keep_alive_and_blank_lines(self):
+        assert OpenRouterBackend._parse_stream_line(": OPENROUTER PROCESSING") == ""
+        assert OpenRouterBackend._parse_stream_line("") == ""
+
+    def test_done(self):
+        assert OpenRouterBackend._parse_stream_line("data: [DONE]") is None
+
+    def test_error(self):
+        line = sse({"error": {"message": "rate limited"}})
+        with pytest.raises(Exception, match="rate limited"):
+            OpenRouterBackend._parse_stream_line(line)
@@ -0,0 +1,27 @@
+"""Unit tests for spotting the decision in a partial AI response."""
+
+import pytest
+
+from agent.manager import DECISION_PATTERN
+
+
+class TestDecisionPattern:
+    @pytest.mark.parametrize(
+        "text, decision",
+        [
+            ('{"decision": "YES"}', "YES"),
+            ('{"reasoning": "...", "decision":"no"}', "no"),
+            ('{ "decision" :  " NO " }', "NO"),
+        ],
+    )
+    def test_matches_decision(self, text, decision):
+        match = DECISION_PATTERN.search(text)
+        assert match is not None
+        assert match.group(1) == decision
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"decision": "YE', '{"decision": "MAYBE"}', '{"answer": "YES"}'],
+    )
+    def test_no_match_until_complete(self, text):
+        assert DECISION_PATTERN.search(text) is None
@@ -0,0 +1,47 @@
+"""Unit tests for the oracle's raw return-data decoders."""
+
+import pytest
+from eth_abi import encode
+from web3.exceptions import BadFunctionCallOutput
+
+from agent.oracle import Oracle, decode_address_array
+
+ADDRESSES = [
+    "0x02b78e1c7e61afa62613f3c9d8de2c81ab551637",
+    "0xe8622fa7282f8824c1ce37b27c2f844828b5d60e",
+]
+
+
+class TestDecodeAddressArray:
+    def test_matches_abi_encoding(self):
+        data = encode(["address[]"], [ADDRESSES])
+        assert decode_address_array(data) == ADDRESSES
+
+    def test_empty_array(self):
+        assert decode_address_array(encode(["address[]"], [[]])) == []
+
+    def test_empty_return_data(self):
+        with pytest.raises(BadFunctionCallOutput):
+            decode_address_array(b"")
+
+    def test_truncated_return_data(self):
+        data = encode(["address[]"], [ADDRESSES])
+        with pytest.raises(BadFunctionCallOutput):
+            decode_address_array(data[:-32])
+
+
+class TestFeeEstimateFromHistory:
+    def test_median_reward_and_next_base_fee(self):
+        fee_history = {
+            "baseFeePerGas": [10, 11, 12, 13],
+            "reward": [[5], [1], [3]],
+        }
+        assert Oracle._fee_estimate_from_history(fee_history) == (13, 3)
+
+    def test_skips_blocks_without_rewards(self):
+        fee_history = {"baseFeePerGas": [7, 8], "reward": [[], [4], []]}
+        assert Oracle._fee_estimate_from_history(fee_history) == (8, 4)
+
+    def test_no_rewards(self):
+        fee_history = {"baseFeePerGas": [9], "reward": []}
+        assert Oracle._fee_estimate_from_history(fee_history) == (9, 0)